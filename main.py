@@ -2,6 +2,18 @@ import pygame
 import random
 import math
 import heapq
+import time
+import os
+import sys
+import concurrent.futures
+import multiprocessing
+import threading
+from collections import OrderedDict, deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # NumPy is optional, the grid falls back to plain Python rows
 
 
 """
@@ -18,20 +30,68 @@ F5 = Obstacles
 # Initialize pygame
 pygame.init()
 
+# Asset registry, every image, font and sound is read from disk once and the loaded object is shared
+class AssetRegistry:
+    def __init__(self):
+        self.assets = {}  # (kind, path, options) -> loaded asset
+        self.stats = {}  # same key -> (load time in ms, bytes in memory)
+
+    def load(self, key, loader, size_of):
+        asset = self.assets.get(key)
+        if asset is None:
+            start = time.perf_counter()
+            asset = loader()
+            self.stats[key] = ((time.perf_counter() - start) * 1000, size_of(asset))
+            self.assets[key] = asset
+        return asset
+
+    def image(self, path, alpha=True, size=None):
+        # Shared surface, copy it before drawing on it
+        def loader():
+            surface = pygame.image.load(path)
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+            return surface
+        return self.load(("image", path, (alpha, size)), loader,
+                         lambda surface: surface.get_width() * surface.get_height() * surface.get_bytesize())
+
+    def font(self, path, size):
+        return self.load(("font", path, size), lambda: pygame.font.Font(path, size), lambda _: os.path.getsize(path))
+
+    def sound(self, path):
+        def size_of(sound):
+            frequency, sample_format, channels = pygame.mixer.get_init()
+            return int(sound.get_length() * frequency * channels * abs(sample_format) // 8)
+        return self.load(("sound", path, None), lambda: pygame.mixer.Sound(path), size_of)
+
+    def total_bytes(self):
+        return sum(size for _, size in self.stats.values())
+
+    def report(self):
+        print(f"{'Asset':<40}{'Load ms':>10}{'KB':>10}")
+        for (kind, path, options), (load_ms, size) in sorted(self.stats.items(), key=lambda item: -item[1][0]):
+            label = f"{kind} {path}" + (f" {options}pt" if kind == "font" else "")
+            print(f"{label:<40}{load_ms:>10.1f}{size / 1024:>10.0f}")
+        total_ms = sum(load_ms for load_ms, _ in self.stats.values())
+        print(f"{'Total ' + str(len(self.stats)) + ' assets':<40}{total_ms:>10.1f}{self.total_bytes() / 1024:>10.0f}")
+
+assets = AssetRegistry()
+
 # Load sounds
-gunshot_sound = pygame.mixer.Sound("sounds/gunshot.mp3")
-reload_sound = pygame.mixer.Sound("sounds/reload.mp3")
-zombie_death_sound = pygame.mixer.Sound("sounds/zombie_death.mp3")
-player_hurt_sound = pygame.mixer.Sound("sounds/player_hurt.mp3")
-shop_open_sound = pygame.mixer.Sound("sounds/shop_open.mp3")
-shop_buy_sound = pygame.mixer.Sound("sounds/shop_buy.mp3")
-sound_track = pygame.mixer.Sound("sounds/sound_track.mp3")
-start_sound = pygame.mixer.Sound("sounds/start.mp3")
-gameover_sound = pygame.mixer.Sound("sounds/gameover.mp3")
-background_music = pygame.mixer.Sound("sounds/background.mp3")
-crop_planted_sound = pygame.mixer.Sound("sounds/crop_planted.mp3")
-crop_harvested_sound = pygame.mixer.Sound("sounds/crop_harvested.mp3")
-spitter_attack_sound = pygame.mixer.Sound("sounds/spit.mp3")
+gunshot_sound = assets.sound("sounds/gunshot.mp3")
+reload_sound = assets.sound("sounds/reload.mp3")
+zombie_death_sound = assets.sound("sounds/zombie_death.mp3")
+player_hurt_sound = assets.sound("sounds/player_hurt.mp3")
+shop_open_sound = assets.sound("sounds/shop_open.mp3")
+shop_buy_sound = assets.sound("sounds/shop_buy.mp3")
+sound_track = assets.sound("sounds/sound_track.mp3")
+start_sound = assets.sound("sounds/start.mp3")
+gameover_sound = assets.sound("sounds/gameover.mp3")
+background_music = assets.sound("sounds/background.mp3")
+crop_planted_sound = assets.sound("sounds/crop_planted.mp3")
+crop_harvested_sound = assets.sound("sounds/crop_harvested.mp3")
+spitter_attack_sound = assets.sound("sounds/spit.mp3")
 
 # Volumes and set number of chanels
 pygame.mixer.set_num_channels(32)
@@ -50,9 +110,14 @@ spitter_attack_sound.set_volume(0.3)
 WIDTH, HEIGHT = 1280, 720
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Blood And Blooms")
-icon = pygame.image.load("Images/zombie.png")
+icon = assets.image("Images/zombie.png")
 pygame.display.set_icon(icon)
 
+# Preload every image used after startup, spawning zombies or opening menus never touches the disk
+ZOMBIE_IMAGES = ["zombie.png", "tank_zombie.png", "runner_zombie.png", "spitter_zombie.png"]
+for image_path in ZOMBIE_IMAGES + ["menu.jpg", "menu1.jpg", "death.png"]:
+    assets.image("Images/" + image_path)
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -67,9 +132,9 @@ PURPLE = (128, 0, 128)
 GRAY = (100, 100, 100)
 
 # Fonts
-font = pygame.font.Font("04B_30__.TTF", 26)
-gameover_font = pygame.font.Font("04B_30__.TTF", 50)
-shop_font = pygame.font.Font("04B_30__.TTF", 32)
+font = assets.font("04B_30__.TTF", 26)
+gameover_font = assets.font("04B_30__.TTF", 50)
+shop_font = assets.font("04B_30__.TTF", 32)
 
 # Game clock
 clock = pygame.time.Clock()
@@ -94,6 +159,41 @@ TEXT_BOBBING_INTERVAL = 300
 TEXT_BOBBING_STEP = 0.5
 TEXT_BOBBING_RANGE = 2
 NEXT_WAVE_EVENT = pygame.USEREVENT + 2
+USE_FLOW_FIELD = False # Zombies share one distance field towards the player instead of running A* each, pays off for big waves
+FLOW_FIELD_LOOKAHEAD = 4 # How many cells of the flow field a zombie reads per path update
+FLOW_FIELD_UNREACHED = 1 << 30 # Flow field distance of cells not reached ( yet )
+USE_NUMPY_GRID = np is not None # Back the pathfinding grid with a NumPy uint8 array when available
+PATH_CACHE_SIZE = 512 # Max number of cached find_path results
+PATH_WORKERS = 2 # Background pathfinding workers, 0 searches on the main thread
+PATH_WORKER_PROCESSES = False # Without free-threading workers are forked processes, forking next to SDL's threads isn't safe
+PATH_BUDGET_MS = 2 # Time per frame the path scheduler may spend on zombie paths
+PATHFINDING_STRATEGY = "jps" # "astar", "jps" ( Jump Point Search ) or "hpa" ( hierarchical, for big maps and small GRID_SIZE )
+SPATIAL_HASH_CELL_SIZE = 100 # Bucket size in pixels for zombie neighbor lookups
+SPATIAL_HASH_MARGIN = 16 # Extra query range for zombies that moved since the buckets were built this frame
+OBSTACLE_FIELD_CELL = 4 # Pixel spacing of the obstacle distance field used to push stuck entities out
+OBSTACLE_FIELD_RANGE = 64 # How far from obstacles the distance field is computed, must be more than any entity radius
+PRECISE_STUCK_CHECK = False # Use pixel masks instead of the distance field for stuck entities ( slow )
+USE_BATCH_SEPARATION = np is not None # Separate all zombies in one NumPy pass instead of per zombie
+ROTATION_STEP = 3 # Degrees between cached sprite rotations
+ROTATION_CACHE_MB = 64 # Memory cap for cached rotated sprites
+PREWARM_ROTATIONS = False # Rotate weapon sprites to every angle at load time instead of on first use
+PATH_SMOOTHING = True # Collapse straight runs of paths into few waypoints and chase the player directly when nothing is in the way
+HPA_CLUSTER_SIZE = 10 # Cluster width/height in cells for the hierarchical strategy
+HPA_REFINE_SEGMENTS = 4 # Abstract path segments turned into cells per search, zombies repath before reaching the rest
+ASSET_REPORT = False # Print load time and memory of every asset at startup
+USE_DIRTY_RECTS = True # Only restore and push the screen areas that changed instead of the whole frame
+DIRTY_RECT_MAX_FRACTION = 0.5 # Changed area ( share of the screen ) above which a full redraw is cheaper
+DIRTY_RECT_TILE = 32 # Changed areas are merged into tiles of this size before they're measured and pushed
+DIRTY_RECT_MAX_RECTS = 256 # Merged rects per frame above which a full redraw is cheaper
+TEXT_CACHE_SIZE = 256 # Max number of rendered text surfaces kept for reuse
+PARTICLE_CAPACITY = 2048 # Max blood particles alive at once, extra spawns are skipped
+PARTICLE_ALPHA_STEPS = 8 # Pre-faded copies of each particle sprite
+USE_NUMPY_PARTICLES = np is not None # Move all particles in one NumPy step instead of one by one
+MUZZLE_FLASH_VARIANTS = 8 # Random muzzle flash shapes generated at startup
+MUZZLE_FLASH_FRAMES = 6 # Animation frames per muzzle flash shape
+BULLET_POOL_SIZE = 128 # Bullets created up front and kept for reuse
+SPIT_POOL_SIZE = 32 # Spit projectiles created up front and kept for reuse
+FARM_STALK_HEIGHT = 40 # Height of fully grown wheat, also the number of growth stages the farm is redrawn for
 
 COLLISION_RECTS = [ 
     # Graves
@@ -142,47 +242,152 @@ MONUMENT_WALLS = [ # Used just for bullet collisions
     pygame.Rect(879, 623, 274, 25),
 ]
 
+# Least recently used cache, drops the oldest entries past max_entries or past max_size ( summed with size_of )
+class LRUCache:
+    def __init__(self, max_entries=None, max_size=None, size_of=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.size_of = size_of
+        self.entries = OrderedDict()  # Oldest first
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if self.size_of is not None:
+            if key in self.entries:
+                self.size -= self.size_of(self.entries[key])
+            self.size += self.size_of(value)
+        self.entries[key] = value
+        while len(self.entries) > 1 and ((self.max_entries is not None and len(self.entries) > self.max_entries) or
+                                         (self.max_size is not None and self.size > self.max_size)):
+            _, dropped = self.entries.popitem(last=False)  # Drop least recently used
+            if self.size_of is not None:
+                self.size -= self.size_of(dropped)
+
+    def __len__(self):
+        return len(self.entries)
+
 class PathfindingGrid:
-    def __init__(self):
-        self.grid = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-        self.zombie_positions = set()  # Track zombie positions
+    def __init__(self, use_flow_field=USE_FLOW_FIELD, use_numpy=USE_NUMPY_GRID, strategy=PATHFINDING_STRATEGY):
+        if strategy not in ("astar", "jps", "hpa"):
+            raise ValueError(f"Unknown pathfinding strategy: {strategy}")
+        self.strategy = strategy
+        self.last_expansions = 0  # Cells expanded by the last search, for comparing strategies
+        self.hpa_version = None  # obstacle_version the abstract graph was built with
+        self.hpa_edges = {}  # Entrance cell -> {neighbor entrance cell: cost}
+        self.hpa_segments = {}  # (entrance, neighbor entrance) -> cells between them
+        self.use_numpy = use_numpy and np is not None
+        # Each layer is one contiguous uint8 buffer ( row major ) plus a [y][x] view sharing its memory
+        self.static_cells, self.static_grid = self.new_grid()  # Graves only, baked once in update_obstacles
+        self.cells, self.grid = self.new_grid()  # Static layer plus zombie occupancy
+        self.zombie_cells = set()  # Cells currently occupied by zombies
+        self.version = 0  # Bumped whenever any cell of self.grid changes
+        self.obstacle_version = 0  # Bumped only when the static obstacles change
+        self.use_flow_field = use_flow_field
+        self.flow_target = None  # Cell the flow field currently points to
+        self.flow_version = None  # obstacle_version the flow field was built with
+        self.flow_next = None  # For every cell index, the next cell index on the way to flow_target ( -1 = unreachable )
+        self.flow_neighbors = []  # For every cell index, its walkable neighbors and move costs
+        self.flow_wanted = None  # Latest target cell asked for
+        self.flow_job = None  # Rebuild in progress, advanced by the path scheduler within its frame budget
+        self.path_cache = LRUCache(PATH_CACHE_SIZE)  # (start_node, end_node, obstacle_version) -> waypoints
+        self.nearest_walkable = []  # For every cell, the closest walkable cell ( itself if walkable )
         self.update_obstacles()
     
+    def new_grid(self):
+        cells = bytearray(GRID_WIDTH * GRID_HEIGHT)
+        if self.use_numpy:
+            # NumPy array on top of the same buffer, no copy
+            return cells, np.frombuffer(cells, dtype=np.uint8).reshape(GRID_HEIGHT, GRID_WIDTH)
+        rows = memoryview(cells)
+        return cells, [rows[y * GRID_WIDTH:(y + 1) * GRID_WIDTH] for y in range(GRID_HEIGHT)]
+
     def update_obstacles(self):
-        # Clear grid
-        self.grid = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        # Bake the static layer
+        self.static_cells[:] = bytes(len(self.static_cells))
         
         # Mark graves as obstacles
         for grave in COLLISION_RECTS:
-            x1 = grave.left // GRID_SIZE
-            y1 = grave.top // GRID_SIZE
-            x2 = grave.right // GRID_SIZE
-            y2 = grave.bottom // GRID_SIZE
+            x1 = max(0, grave.left // GRID_SIZE)
+            y1 = max(0, grave.top // GRID_SIZE)
+            x2 = min(GRID_WIDTH - 1, grave.right // GRID_SIZE)
+            y2 = min(GRID_HEIGHT - 1, grave.bottom // GRID_SIZE)
             
-            for x in range(x1, x2 + 1):
+            if self.use_numpy:
+                self.static_grid[y1:y2 + 1, x1:x2 + 1] = 1  # 1 means obstacle
+            else:
                 for y in range(y1, y2 + 1):
-                    if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
-                        self.grid[y][x] = 1  # 1 means obstacle
+                    self.static_grid[y][x1:x2 + 1] = bytes([1]) * (x2 + 1 - x1)
         
-        # Mark zombie positions as temporary obstacles
-        for (zx, zy) in self.zombie_positions:
-            gx, gy = zx // GRID_SIZE, zy // GRID_SIZE
-            if 0 <= gx < GRID_WIDTH and 0 <= gy < GRID_HEIGHT:
-                self.grid[gy][gx] = 2  # 2 means temporary zombie obstacle
+        # Put the zombie layer back on top of the fresh static layer
+        self.cells[:] = self.static_cells
+        for (gx, gy) in self.zombie_cells:
+            i = gy * GRID_WIDTH + gx
+            if self.cells[i] == 0:
+                self.cells[i] = 2  # 2 means temporary zombie obstacle
+
+        self.build_walkable_cells()
+        self.build_nearest_walkable()
+        self.build_flow_neighbors()
+        self.obstacle_version += 1
+        self.version += 1
 
     def update_zombie_positions(self, zombies):
-        self.zombie_positions = set()
+        new_cells = set()
         for zombie in zombies:
-            # Store center position of each zombie
-            self.zombie_positions.add((zombie.rect.centerx, zombie.rect.centery))
-        self.update_obstacles()
+            # Store grid cell of each zombie center
+            gx, gy = zombie.rect.centerx // GRID_SIZE, zombie.rect.centery // GRID_SIZE
+            if 0 <= gx < GRID_WIDTH and 0 <= gy < GRID_HEIGHT:
+                new_cells.add((gx, gy))
+
+        # Only touch cells whose occupancy changed
+        left_cells = self.zombie_cells - new_cells
+        entered_cells = new_cells - self.zombie_cells
+        for (gx, gy) in left_cells:
+            i = gy * GRID_WIDTH + gx
+            self.cells[i] = self.static_cells[i]
+        for (gx, gy) in entered_cells:
+            i = gy * GRID_WIDTH + gx
+            if self.static_cells[i] == 0:
+                self.cells[i] = 2  # Zombies never overwrite graves
+
+        self.zombie_cells = new_cells
+        if left_cells or entered_cells:
+            self.version += 1
+
+    def build_walkable_cells(self):
+        # Walkable cells with a blocked border around the grid, for the Jump Point Search inner loops
+        self.walkable_cells = bytearray((GRID_WIDTH + 2) * (GRID_HEIGHT + 2))
+        for y in range(GRID_HEIGHT):
+            row = (y + 1) * (GRID_WIDTH + 2) + 1
+            for x in range(GRID_WIDTH):
+                self.walkable_cells[row + x] = self.cells[y * GRID_WIDTH + x] != 1
 
     def is_walkable(self, x, y):
-        if 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
-            return self.grid[y][x] != 1  # Walkable if not a permanent obstacle
-        return False
+        # Walkable if not a permanent obstacle
+        return 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT and self.cells[y * GRID_WIDTH + x] != 1
 
     def find_path(self, start_pos, end_pos):
+        start_node, end_node = self.path_nodes(start_pos, end_pos)
+
+        # Zombies in the same cells ask for the same path, often several times per frame
+        path = self.cached_path(start_node, end_node)
+        if path is None:
+            path = self.search_path(start_node, end_node)
+            self.cache_path(start_node, end_node, self.obstacle_version, path)
+        return path
+
+    def path_nodes(self, start_pos, end_pos):
         # Convert to grid coordinates
         start_node = (start_pos[0] // GRID_SIZE, start_pos[1] // GRID_SIZE)
         end_node = (end_pos[0] // GRID_SIZE, end_pos[1] // GRID_SIZE)
@@ -192,7 +397,75 @@ class PathfindingGrid:
             start_node = self.find_nearest_walkable(*start_node)
         if not self.is_walkable(*end_node):
             end_node = self.find_nearest_walkable(*end_node)
-            
+        return start_node, end_node
+
+    def cached_path(self, start_node, end_node):
+        return self.path_cache.get((start_node, end_node, self.obstacle_version))
+
+    def cache_path(self, start_node, end_node, version, path):
+        if version != self.obstacle_version:
+            return  # Searched on an outdated grid
+        self.path_cache.put((start_node, end_node, version), path)  # Shared between zombies, never modified
+
+    def search_path(self, start_node, end_node):
+        if self.strategy == "hpa":
+            path = self.hierarchical_search(start_node, end_node)
+        elif self.strategy == "jps":
+            path = self.jump_point_search(start_node, end_node)
+        else:
+            path = self.a_star(start_node, end_node)
+        return self.smooth_path(start_node, path) if PATH_SMOOTHING else path
+
+    # String pulling, drop every waypoint the previous kept one can see past
+    def smooth_path(self, start_node, path):
+        if len(path) < 2:
+            return path
+        cells = [(x // GRID_SIZE, y // GRID_SIZE) for (x, y) in path]
+        smoothed = []
+        anchor = start_node
+        for i in range(len(path) - 1):
+            if not self.has_line_of_sight(anchor, cells[i + 1]):
+                smoothed.append(path[i])
+                anchor = cells[i]
+        smoothed.append(path[-1])
+        return smoothed
+
+    def has_line_of_sight(self, a, b):
+        # Walk every cell the line between the two cell centers touches
+        x, y = a
+        nx, ny = abs(b[0] - x), abs(b[1] - y)
+        sx = 1 if b[0] > x else -1
+        sy = 1 if b[1] > y else -1
+        ix = iy = 0
+        while ix < nx or iy < ny:
+            decision = (1 + 2 * ix) * ny - (1 + 2 * iy) * nx
+            if decision == 0:
+                # Line goes exactly through a corner, both side cells must be free
+                if not self.is_walkable(x + sx, y) or not self.is_walkable(x, y + sy):
+                    return False
+                x += sx
+                y += sy
+                ix += 1
+                iy += 1
+            elif decision < 0:
+                x += sx
+                ix += 1
+            else:
+                y += sy
+                iy += 1
+            if not self.is_walkable(x, y):
+                return False
+        return True
+
+    def direct_path(self, start_pos, end_pos):
+        # Straight line chase if nothing blocks it, None otherwise
+        start_node = (start_pos[0] // GRID_SIZE, start_pos[1] // GRID_SIZE)
+        end_node = (end_pos[0] // GRID_SIZE, end_pos[1] // GRID_SIZE)
+        if self.is_walkable(*start_node) and self.has_line_of_sight(start_node, end_node):
+            return [end_pos]
+        return None
+
+    def a_star(self, start_node, end_node):
         # Use A* algorithm with priority queue for better performance
         open_set = []
         heapq.heappush(open_set, (0, start_node))
@@ -202,10 +475,12 @@ class PathfindingGrid:
         f_score = {start_node: self.heuristic(start_node, end_node)}
         
         open_set_hash = {start_node}  # For quick lookup
+        self.last_expansions = 0
         
         while open_set:
             current = heapq.heappop(open_set)[1]
             open_set_hash.remove(current)
+            self.last_expansions += 1
             
             if current == end_node:
                 path = []
@@ -234,6 +509,274 @@ class PathfindingGrid:
         
         return []  # No path found
 
+    # Jump Point Search, A* that skips over the symmetric cells of open areas
+    def jump_point_search(self, start_node, end_node):
+        open_set = [(0, start_node)]
+        came_from = {}
+        g_score = {start_node: 0}
+        closed = set()
+        self.last_expansions = 0
+
+        while open_set:
+            current = heapq.heappop(open_set)[1]
+            if current in closed:
+                continue  # Outdated queue entry
+            closed.add(current)
+            self.last_expansions += 1
+
+            if current == end_node:
+                # Fill in the cells between jump points so waypoints match A*
+                path = []
+                while current in came_from:
+                    parent = came_from[current]
+                    step_x = (current[0] > parent[0]) - (current[0] < parent[0])
+                    step_y = (current[1] > parent[1]) - (current[1] < parent[1])
+                    while current != parent:
+                        path.append(current)
+                        current = (current[0] - step_x, current[1] - step_y)
+                path.reverse()
+                return [(x * GRID_SIZE + GRID_SIZE//2, y * GRID_SIZE + GRID_SIZE//2)
+                       for (x, y) in path]
+
+            for dx, dy in self.jps_directions(current, came_from.get(current)):
+                jump_point = self.jump(current[0], current[1], dx, dy, end_node)
+                if jump_point is None or jump_point in closed:
+                    continue
+
+                # Jumps are straight or diagonal runs, so cost is steps * move cost
+                steps = max(abs(jump_point[0] - current[0]), abs(jump_point[1] - current[1]))
+                tentative_g = g_score[current] + steps * (1.4 if dx and dy else 1)
+
+                if jump_point not in g_score or tentative_g < g_score[jump_point]:
+                    came_from[jump_point] = current
+                    g_score[jump_point] = tentative_g
+                    heapq.heappush(open_set, (tentative_g + self.heuristic(jump_point, end_node), jump_point))
+
+        return []  # No path found
+
+    def jps_directions(self, node, parent):
+        # Start node looks everywhere
+        if parent is None:
+            return [(0,1), (1,0), (0,-1), (-1,0), (1,1), (1,-1), (-1,1), (-1,-1)]
+
+        x, y = node
+        dx = (x > parent[0]) - (x < parent[0])
+        dy = (y > parent[1]) - (y < parent[1])
+        walkable = self.is_walkable
+
+        # Natural neighbors plus the ones forced by an obstacle beside us
+        if dx and dy:
+            directions = [(dx, dy), (dx, 0), (0, dy)]
+            if not walkable(x - dx, y) and walkable(x - dx, y + dy):
+                directions.append((-dx, dy))
+            if not walkable(x, y - dy) and walkable(x + dx, y - dy):
+                directions.append((dx, -dy))
+        elif dx:
+            directions = [(dx, 0)]
+            if not walkable(x, y + 1) and walkable(x + dx, y + 1):
+                directions.append((dx, 1))
+            if not walkable(x, y - 1) and walkable(x + dx, y - 1):
+                directions.append((dx, -1))
+        else:
+            directions = [(0, dy)]
+            if not walkable(x + 1, y) and walkable(x + 1, y + dy):
+                directions.append((1, dy))
+            if not walkable(x - 1, y) and walkable(x - 1, y + dy):
+                directions.append((-1, dy))
+        return directions
+
+    def jump(self, x, y, dx, dy, end_node):
+        # Walk in one direction until something interesting happens, on the padded walkable layer so no bounds checks
+        walkable = self.walkable_cells
+        stride = GRID_WIDTH + 2
+        i = (y + 1) * stride + x + 1
+        end = (end_node[1] + 1) * stride + end_node[0] + 1
+        if dx and dy:
+            step_y = dy * stride
+            while True:
+                i += dx + step_y
+                if not walkable[i]:
+                    return None
+                if (i == end or
+                    (not walkable[i - dx] and walkable[i - dx + step_y]) or
+                    (not walkable[i - step_y] and walkable[i + dx - step_y]) or
+                    # Diagonal cells are jump points if a straight jump from them finds one
+                    self.jump_straight(i, dx, stride, end) or
+                    self.jump_straight(i, step_y, 1, end)):
+                    return (i % stride - 1, i // stride - 1)
+
+        found = self.jump_straight(i, dx if dx else dy * stride, stride if dx else 1, end)
+        return (found % stride - 1, found // stride - 1) if found else None
+
+    def jump_straight(self, i, step, side, end):
+        # Straight run from padded index i, returns the jump point's padded index or 0 ( always a border cell )
+        walkable = self.walkable_cells
+        while True:
+            i += step
+            if not walkable[i]:
+                return 0
+            if (i == end or
+                (not walkable[i + side] and walkable[i + side + step]) or
+                (not walkable[i - side] and walkable[i - side + step])):
+                return i
+
+    # Hierarchical pathfinding ( HPA* ), plans over cluster entrances and only fills in the first few segments
+    def hierarchical_search(self, start_node, end_node):
+        if self.hpa_version != self.obstacle_version:
+            self.build_hpa_graph()
+
+        # Short trips inside one cluster don't need the abstract graph
+        start_cluster = self.cluster_bounds(start_node)
+        end_cluster = self.cluster_bounds(end_node)
+        if start_cluster == end_cluster:
+            return self.jump_point_search(start_node, end_node)
+
+        # Hook start and end into the abstract graph through their own cluster
+        extra_edges = {start_node: {}}
+        extra_segments = {}
+        dist, came_from = self.cluster_dijkstra(start_node, start_cluster)
+        for entrance in self.cluster_entrances(start_cluster):
+            if entrance in dist and entrance != start_node:
+                extra_edges[start_node][entrance] = dist[entrance]
+                extra_segments[(start_node, entrance)] = self.local_path(came_from, entrance)
+        dist, came_from = self.cluster_dijkstra(end_node, end_cluster)
+        for entrance in self.cluster_entrances(end_cluster):
+            if entrance in dist and entrance != end_node:
+                # Costs are symmetric, so walk the search from end_node backwards
+                cells = self.local_path(came_from, entrance)
+                extra_edges.setdefault(entrance, {})[end_node] = dist[entrance]
+                extra_segments[(entrance, end_node)] = cells[-2::-1] + [end_node]
+
+        # A* over entrances
+        open_set = [(0, start_node)]
+        came_from = {}
+        g_score = {start_node: 0}
+        closed = set()
+        self.last_expansions = 0
+
+        while open_set:
+            current = heapq.heappop(open_set)[1]
+            if current in closed:
+                continue  # Outdated queue entry
+            closed.add(current)
+            self.last_expansions += 1
+
+            if current == end_node:
+                nodes = [current]
+                while current in came_from:
+                    current = came_from[current]
+                    nodes.append(current)
+                nodes.reverse()
+
+                # Refine only the first segments into cells
+                path = []
+                for a, b in list(zip(nodes, nodes[1:]))[:HPA_REFINE_SEGMENTS]:
+                    path += extra_segments.get((a, b)) or self.hpa_segments[(a, b)]
+                return [(x * GRID_SIZE + GRID_SIZE//2, y * GRID_SIZE + GRID_SIZE//2)
+                       for (x, y) in path]
+
+            neighbors = list(self.hpa_edges.get(current, {}).items())
+            neighbors += extra_edges.get(current, {}).items()
+            for neighbor, cost in neighbors:
+                tentative_g = g_score[current] + cost
+                if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    heapq.heappush(open_set, (tentative_g + self.heuristic(neighbor, end_node), neighbor))
+
+        # Some diagonal squeezes between clusters have no entrance, let the flat search decide
+        return self.jump_point_search(start_node, end_node)
+
+    def cluster_bounds(self, node):
+        x0 = node[0] // HPA_CLUSTER_SIZE * HPA_CLUSTER_SIZE
+        y0 = node[1] // HPA_CLUSTER_SIZE * HPA_CLUSTER_SIZE
+        return (x0, y0, min(x0 + HPA_CLUSTER_SIZE, GRID_WIDTH), min(y0 + HPA_CLUSTER_SIZE, GRID_HEIGHT))
+
+    def cluster_entrances(self, bounds):
+        return self.hpa_cluster_entrances.get(bounds, [])
+
+    def build_hpa_graph(self):
+        self.hpa_edges = {}
+        self.hpa_segments = {}
+        self.hpa_cluster_entrances = {}
+
+        def add_entrance(a, b):
+            # a and b are neighboring cells on both sides of a cluster border
+            for cell in (a, b):
+                bounds = self.cluster_bounds(cell)
+                if cell not in self.hpa_edges:
+                    self.hpa_edges[cell] = {}
+                    self.hpa_cluster_entrances.setdefault(bounds, []).append(cell)
+            self.hpa_edges[a][b] = 1
+            self.hpa_edges[b][a] = 1
+            self.hpa_segments[(a, b)] = [b]
+            self.hpa_segments[(b, a)] = [a]
+
+        def scan_border(cells):
+            # cells is a list of (inside, outside) pairs along one border, every open run gets entrances
+            run = []
+            for a, b in cells + [(None, None)]:
+                if a is not None and self.is_walkable(*a) and self.is_walkable(*b):
+                    run.append((a, b))
+                    continue
+                if run:
+                    if len(run) < 6:
+                        add_entrance(*run[len(run) // 2])
+                    else:
+                        # Wide openings get one entrance at each end
+                        add_entrance(*run[0])
+                        add_entrance(*run[-1])
+                run = []
+
+        for x in range(HPA_CLUSTER_SIZE, GRID_WIDTH, HPA_CLUSTER_SIZE):
+            for y0 in range(0, GRID_HEIGHT, HPA_CLUSTER_SIZE):
+                scan_border([((x - 1, y), (x, y)) for y in range(y0, min(y0 + HPA_CLUSTER_SIZE, GRID_HEIGHT))])
+        for y in range(HPA_CLUSTER_SIZE, GRID_HEIGHT, HPA_CLUSTER_SIZE):
+            for x0 in range(0, GRID_WIDTH, HPA_CLUSTER_SIZE):
+                scan_border([((x, y - 1), (x, y)) for x in range(x0, min(x0 + HPA_CLUSTER_SIZE, GRID_WIDTH))])
+
+        # Intra-cluster distances between every pair of entrances
+        for bounds, entrances in self.hpa_cluster_entrances.items():
+            for entrance in entrances:
+                dist, came_from = self.cluster_dijkstra(entrance, bounds)
+                for other in entrances:
+                    if other != entrance and other in dist:
+                        self.hpa_edges[entrance][other] = dist[other]
+                        self.hpa_segments[(entrance, other)] = self.local_path(came_from, other)
+
+        self.hpa_version = self.obstacle_version
+
+    def cluster_dijkstra(self, source, bounds):
+        x0, y0, x1, y1 = bounds
+        dist = {source: 0}
+        came_from = {}
+        open_set = [(0, source)]
+
+        while open_set:
+            d, current = heapq.heappop(open_set)
+            if d > dist[current]:
+                continue  # Outdated queue entry
+
+            for dx, dy in [(0,1), (1,0), (0,-1), (-1,0), (1,1), (1,-1), (-1,1), (-1,-1)]:
+                nx, ny = current[0] + dx, current[1] + dy
+                if not (x0 <= nx < x1 and y0 <= ny < y1) or not self.is_walkable(nx, ny):
+                    continue
+                new_dist = d + (1.4 if dx and dy else 1)
+                if (nx, ny) not in dist or new_dist < dist[(nx, ny)]:
+                    dist[(nx, ny)] = new_dist
+                    came_from[(nx, ny)] = current
+                    heapq.heappush(open_set, (new_dist, (nx, ny)))
+        return dist, came_from
+
+    def local_path(self, came_from, node):
+        # Cells from the search source ( exclusive ) to node ( inclusive )
+        path = []
+        while node in came_from:
+            path.append(node)
+            node = came_from[node]
+        path.reverse()
+        return path
+
     def heuristic(self, a, b):
         # Euclidean distance
         dx = abs(a[0] - b[0])
@@ -241,24 +784,349 @@ class PathfindingGrid:
         return dx + dy + (math.sqrt(2) - 2) * min(dx, dy)
 
     def find_nearest_walkable(self, x, y):
-        # Find nearest walkable cell using Breadth First Search
-        queue = [(x, y)]
-        visited = set()
-        
+        # Cells off the grid snap from the closest edge cell
+        x = min(max(x, 0), GRID_WIDTH - 1)
+        y = min(max(y, 0), GRID_HEIGHT - 1)
+        nearest = self.nearest_walkable[y * GRID_WIDTH + x]
+        return nearest if nearest is not None else (x, y)  # Fallback
+
+    def build_nearest_walkable(self):
+        # Multi source Breadth First Search from every walkable cell at once
+        nearest = [None] * (GRID_WIDTH * GRID_HEIGHT)
+        queue = deque()
+        for i, cell in enumerate(self.static_cells):
+            if cell != 1:
+                nearest[i] = (i % GRID_WIDTH, i // GRID_WIDTH)
+                queue.append(i)
+
         while queue:
-            cx, cy = queue.pop(0)
-            if self.is_walkable(cx, cy):
-                return (cx, cy)
-                
-            visited.add((cx, cy))
-            
+            i = queue.popleft()
+            cx, cy = i % GRID_WIDTH, i // GRID_WIDTH
             for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
                 nx, ny = cx + dx, cy + dy
-                if (0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT and 
-                    (nx, ny) not in visited):
-                    queue.append((nx, ny))
-                    
-        return (x, y)  # Fallback
+                if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT:
+                    n = ny * GRID_WIDTH + nx
+                    if nearest[n] is None:
+                        nearest[n] = nearest[i]
+                        queue.append(n)
+
+        self.nearest_walkable = nearest
+
+    def build_flow_neighbors(self):
+        # For every cell, its walkable neighbors as (index, cost), costs are A*'s 1 and 1.4 times 10
+        neighbors = []
+        for i, cell in enumerate(self.static_cells):
+            cx, cy = i % GRID_WIDTH, i // GRID_WIDTH
+            links = []
+            if cell != 1:
+                for dx, dy in [(0,1), (1,0), (0,-1), (-1,0), (1,1), (1,-1), (-1,1), (-1,-1)]:
+                    nx, ny = cx + dx, cy + dy
+                    if 0 <= nx < GRID_WIDTH and 0 <= ny < GRID_HEIGHT and self.static_cells[ny * GRID_WIDTH + nx] != 1:
+                        links.append((ny * GRID_WIDTH + nx, 14 if dx and dy else 10))
+            neighbors.append(links)
+        self.flow_neighbors = neighbors
+
+    # Flow field ( Dijkstra map ) towards the target, shared by all zombies
+    def update_flow_field(self, target_pos):
+        target_node = (target_pos[0] // GRID_SIZE, target_pos[1] // GRID_SIZE)
+        if not self.is_walkable(*target_node):
+            target_node = self.find_nearest_walkable(*target_node)
+        self.flow_wanted = target_node
+
+        # Only rebuild when the target moved to another cell or the graves changed
+        if self.flow_version != self.obstacle_version:
+            # No usable field at all, build it right away
+            self.start_flow_field(target_node)
+            self.advance_flow_field(float("inf"))
+        elif target_node != self.flow_target and self.flow_job is None:
+            # Zombies keep following the old field until the scheduler finished the new one
+            self.start_flow_field(target_node)
+
+    def start_flow_field(self, target_node):
+        # Flat arrays over the cell index, same layout as self.cells
+        distance = [FLOW_FIELD_UNREACHED] * (GRID_WIDTH * GRID_HEIGHT)
+        flow_next = [-1] * (GRID_WIDTH * GRID_HEIGHT)
+        target = target_node[1] * GRID_WIDTH + target_node[0]
+        distance[target] = 0
+        self.flow_job = (target_node, self.obstacle_version, distance, flow_next, [(0, target)])
+
+    def advance_flow_field(self, deadline):
+        # Run the pending rebuild until it is done or time.perf_counter() passes the deadline, True when done
+        if self.flow_job is None:
+            return True
+        target_node, version, distance, flow_next, open_set = self.flow_job
+        if version != self.obstacle_version:
+            self.flow_job = None  # Graves changed, the next update_flow_field starts over
+            return True
+
+        neighbors = self.flow_neighbors
+        heappop, heappush = heapq.heappop, heapq.heappush
+        clock = time.perf_counter
+        steps = 0
+        while open_set:
+            steps += 1
+            if steps % 64 == 0 and clock() > deadline:
+                return False
+            dist, current = heappop(open_set)
+            if dist > distance[current]:
+                continue  # Outdated queue entry
+
+            for neighbor, cost in neighbors[current]:
+                new_dist = dist + cost
+                if new_dist < distance[neighbor]:
+                    distance[neighbor] = new_dist
+                    flow_next[neighbor] = current  # Step back towards the target
+                    heappush(open_set, (new_dist, neighbor))
+
+        self.flow_target = target_node
+        self.flow_version = version
+        self.flow_next = flow_next
+        self.flow_job = None
+        if self.flow_wanted != target_node:
+            self.start_flow_field(self.flow_wanted)  # Target moved again during the rebuild
+        return True
+
+    def flow_path(self, start_pos, target_pos, max_steps=FLOW_FIELD_LOOKAHEAD):
+        self.update_flow_field(target_pos)
+
+        current = (start_pos[0] // GRID_SIZE, start_pos[1] // GRID_SIZE)
+        if not self.is_walkable(*current):
+            current = self.find_nearest_walkable(*current)
+
+        # Read the next few steps from the field, same waypoint format as find_path
+        path = []
+        i = current[1] * GRID_WIDTH + current[0]
+        target = self.flow_target[1] * GRID_WIDTH + self.flow_target[0]
+        while len(path) < max_steps and i != target:
+            i = self.flow_next[i]
+            if i < 0:
+                break  # Target can't be reached from this cell
+            path.append(((i % GRID_WIDTH) * GRID_SIZE + GRID_SIZE//2, (i // GRID_WIDTH) * GRID_SIZE + GRID_SIZE//2))
+        return path
+
+# Spatial hash, buckets sprites by center so neighbor lookups only look at nearby buckets
+class SpatialHash:
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        self.cell_size = cell_size
+        self.buckets = {}  # (bucket x, bucket y) -> sprites whose center is inside
+        self.max_extent = 0
+
+    def rebuild(self, sprites):
+        self.buckets = {}
+        self.max_extent = 0  # Largest half width/height of anything in the hash
+        size = self.cell_size
+        for sprite in sprites:
+            self.max_extent = max(self.max_extent, sprite.rect.width // 2, sprite.rect.height // 2)
+            key = (sprite.rect.centerx // size, sprite.rect.centery // size)
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                self.buckets[key] = [sprite]
+            else:
+                bucket.append(sprite)
+
+    def query(self, center, radius):
+        # Everything in buckets touching the square around the circle, callers do the exact distance check
+        size = self.cell_size
+        x1, x2 = int((center[0] - radius) // size), int((center[0] + radius) // size)
+        y1, y2 = int((center[1] - radius) // size), int((center[1] + radius) // size)
+        result = []
+        for bx in range(x1, x2 + 1):
+            for by in range(y1, y2 + 1):
+                bucket = self.buckets.get((bx, by))
+                if bucket:
+                    result.extend(bucket)
+        return result
+
+# Runs in the pathfinding workers, each worker thread keeps its own grid for the latest obstacle version
+worker_state = threading.local()
+
+def search_path_job(snapshot, version, strategy, start_node, end_node):
+    grid = getattr(worker_state, "grid", None)
+    if grid is None or worker_state.version != version:
+        grid = PathfindingGrid(use_flow_field=False, use_numpy=False, strategy=strategy)
+        grid.cells[:] = snapshot
+        grid.build_walkable_cells()
+        worker_state.grid = grid
+        worker_state.version = version
+    return grid.search_path(start_node, end_node)
+
+# Worker pool for pathfinding, None means paths are searched on the main thread
+def create_path_executor(workers=PATH_WORKERS):
+    if workers <= 0:
+        return None
+    # Free-threaded Python can search on threads that share the game's memory
+    if hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled():
+        return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    # Otherwise use processes, forked so they don't re-run the game's startup code
+    if PATH_WORKER_PROCESSES and sys.platform.startswith("linux"):
+        return concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                      mp_context=multiprocessing.get_context("fork"))
+    return None
+
+# Async pathfinding, hands out futures that zombies poll each frame
+class AsyncPathService:
+    def __init__(self, grid, executor):
+        self.grid = grid
+        self.executor = executor
+        self.dropped_results = 0  # Paths thrown away because the grid changed during the search
+        self.in_flight = {}  # path_key -> future of a search still running, zombies asking for the same path share it
+        self.shared_requests = 0  # Requests answered by a search that was already running
+
+    def submit(self, start_pos, end_pos):
+        start_node, end_node = self.grid.path_nodes(start_pos, end_pos)
+        version = self.grid.obstacle_version
+        path_key = (start_node, end_node, version)
+
+        future = self.in_flight.get(path_key)
+        if future is not None:
+            if not future.done():
+                self.shared_requests += 1
+                return future
+            self.result(future)  # Finished but nobody picked it up, this puts it in the path cache
+        elif len(self.in_flight) > PATH_CACHE_SIZE:
+            # Searches for zombies that died before reading them
+            self.in_flight = {key: running for key, running in self.in_flight.items() if not running.done()}
+
+        path = self.grid.cached_path(start_node, end_node)
+        future = None
+        if path is None and self.executor is not None:
+            try:
+                future = self.executor.submit(search_path_job, bytes(self.grid.static_cells), version,
+                                              self.grid.strategy, start_node, end_node)
+                self.in_flight[path_key] = future
+            except Exception as error:
+                self.stop_workers(error)
+        if future is None:
+            # Cache hits and the synchronous fallback come back already done
+            future = concurrent.futures.Future()
+            future.set_result(path if path is not None else self.grid.search_path(start_node, end_node))
+        future.path_key = path_key
+        return future
+
+    def result(self, future):
+        # None if the path was searched against an outdated grid
+        start_node, end_node, version = future.path_key
+        if self.in_flight.get(future.path_key) is future:
+            del self.in_flight[future.path_key]
+        if version != self.grid.obstacle_version:
+            self.dropped_results += 1
+            return None
+        try:
+            path = future.result()
+        except (Exception, concurrent.futures.CancelledError) as error:
+            # A worker died ( BrokenProcessPool ) or the search failed, search here and stop using the workers
+            if self.executor is not None:
+                self.stop_workers(error)
+            path = self.grid.search_path(start_node, end_node)
+        self.grid.cache_path(start_node, end_node, version, path)
+        return path
+
+    def stop_workers(self, error):
+        global path_executor
+        print(f"Pathfinding workers failed ( {error!r} ), searching on the main thread")
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = None
+        path_executor = None  # Later games start without the broken pool too
+
+# Path scheduler, spreads zombie path updates over frames so big waves don't hitch
+class PathScheduler:
+    def __init__(self, budget_ms=PATH_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.pending = {}  # Zombies waiting for a path ( dict keeps it a set without duplicates )
+        self.served_last_frame = 0
+
+    def request(self, zombie):
+        self.pending[zombie] = None
+
+    def run(self, player_pos):
+        # Zombies without a path first, then the ones closest to the player
+        def priority(zombie):
+            has_path = bool(zombie.path) and zombie.current_target_index < len(zombie.path)
+            dx = zombie.rect.centerx - player_pos[0]
+            dy = zombie.rect.centery - player_pos[1]
+            return (has_path, dx * dx + dy * dy)
+
+        start = time.perf_counter()
+        self.served_last_frame = 0
+
+        # A pending flow field rebuild counts against the budget too, it continues next frame if needed
+        if pathfinding_grid.use_flow_field:
+            pathfinding_grid.advance_flow_field(start + self.budget_ms / 1000)
+
+        queue = sorted(self.pending, key=priority)
+        for zombie in queue:
+            # Always serve at least one zombie so the queue keeps moving
+            if self.served_last_frame and (time.perf_counter() - start) * 1000 > self.budget_ms:
+                break
+            del self.pending[zombie]
+            if zombie.alive():
+                zombie.refresh_path()
+                self.served_last_frame += 1
+
+# Rotated sprite cache, angles are snapped to ROTATION_STEP so all sprites sharing an image share its rotations
+# Each rotation comes with its collision mask so masks always match the image on screen
+class RotationCache:
+    def __init__(self, step=ROTATION_STEP, max_bytes=ROTATION_CACHE_MB * 1024 * 1024):
+        self.step = step
+        self.cache = LRUCache(max_size=max_bytes, size_of=self.entry_bytes)  # (key, snapped angle) -> (rotated surface, mask)
+
+    def rotate(self, image, angle, key=None):
+        # Returns (surface, mask), both shared, never draw on them
+        snapped = self.snap(angle)
+        cache_key = (key if key is not None else image, snapped)
+        rotated = self.cache.get(cache_key)
+        if rotated is None:
+            surface = pygame.transform.rotate(image, snapped)
+            rotated = (surface, pygame.mask.from_surface(surface))
+            self.cache.put(cache_key, rotated)
+        return rotated
+
+    def snap(self, angle):
+        return round(angle / self.step) * self.step % 360
+
+    def prewarm(self, image, key=None):
+        for angle in range(0, 360, self.step):
+            self.rotate(image, angle, key)
+
+    @staticmethod
+    def entry_bytes(entry):
+        surface = entry[0]
+        # Pixels plus one bit per pixel for the mask
+        return surface.get_width() * surface.get_height() * (surface.get_bytesize() + 1 / 8)
+
+rotation_cache = RotationCache()
+
+# Rendered text surfaces, a string is rasterized once and reused until it falls out of the cache
+class TextCache:
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.cache = LRUCache(max_entries)  # (font, text, color, antialias) -> surface
+
+    def render(self, font, text, color, antialias=True):
+        # Shared surface, never draw on it or change its alpha
+        key = (font, text, tuple(color), antialias)
+        surface = self.cache.get(key)
+        if surface is None:
+            surface = font.render(text, antialias, color)
+            self.cache.put(key, surface)
+        return surface
+
+text_cache = TextCache()
+
+# HUD text bound to a value, only looked up again when the text changes
+class TextWidget:
+    def __init__(self, font, color, get_text):
+        self.font = font
+        self.color = color
+        self.get_text = get_text
+        self.text = None
+        self.surface = None
+
+    def draw(self, screen, pos):
+        text = self.get_text()
+        if text != self.text:
+            self.text = text
+            self.surface = text_cache.render(self.font, text, self.color)
+        return screen.blit(self.surface, pos)
 
 # Player health class system with 3 hearts and invincibility frames
 class PlayerHealth:
@@ -308,9 +1176,7 @@ class PlayerHealth:
         current_time = pygame.time.get_ticks()
         if not self.is_invincible or current_time - self.last_hit_time > self.iframes_duration:
             player_hurt_sound.play()
-            for _ in range(random.randint(8, 15)):
-                        particle = BloodParticle(player.rect.centerx, player.rect.centery)
-                        all_sprites.add(particle)
+            blood_particles.spawn(player.rect.centerx, player.rect.centery, random.randint(8, 15))
             self.hearts -= amount
             self.last_hit_time = current_time
             self.is_invincible = True
@@ -340,15 +1206,18 @@ class PlayerHealth:
             else:
                 screen.blit(self.heart_images['empty'], heart_pos)
 
+        # Area the hearts may cover, for dirty rect rendering
+        return pygame.Rect(10, 10, self.max_hearts * (self.heart_width + 4), self.heart_height)
+
 # Initialize player health
 player_health = PlayerHealth()
 
 # Weapon class
 class Weapon:
     def __init__(self, name, damage, fire_rate, ammo, reload_time, cost, 
-                 spread=0, projectile_speed=15, is_automatic=False, max_range=500):
+                 spread=0, projectile_speed=15, is_automatic=False, max_range=500, pierce=0):
         self.name = name
-        self.combined_image = pygame.image.load(f"Images/player_{name.lower()}.png").convert_alpha()
+        self.combined_image = assets.image(f"Images/player_{name.lower()}.png")
         
         self.damage = damage
         self.fire_rate = fire_rate
@@ -360,6 +1229,7 @@ class Weapon:
         self.projectile_speed = projectile_speed
         self.is_automatic = is_automatic
         self.max_range = max_range
+        self.pierce = pierce  # Extra zombies a bullet goes through before stopping
 
 weapons = {
     "Pistol": Weapon("Pistol", 25, 200, 10, 2000, 0, 
@@ -372,6 +1242,9 @@ weapons = {
                     projectile_speed=30, max_range=2000)  
 }
 weapons["Pistol"].purchased = True  # Starting weapon is already purchased
+if PREWARM_ROTATIONS:
+    for weapon in weapons.values():
+        rotation_cache.prewarm(weapon.combined_image)
 
 # Shop function
 def show_shop():
@@ -409,14 +1282,14 @@ def show_shop():
         screen.fill(BLACK)
         
         # Current balance
-        balance_text = font.render(f"Balance: ${player_money}", True, GREEN)
+        balance_text = text_cache.render(font, f"Balance: ${player_money}", GREEN)
         screen.blit(balance_text, (WIDTH//2 - balance_text.get_width()//2, 80))
         
         # Shop title
-        title_text = shop_font.render("Shop", True, WHITE)
+        title_text = text_cache.render(shop_font, "Shop", WHITE)
         screen.blit(title_text, (WIDTH//2 - title_text.get_width()//2, 30))
 
-        info_text = font.render("Press 1-3 to buy/equip or ESC to exit", True, WHITE)
+        info_text = text_cache.render(font, "Press 1-3 to buy/equip or ESC to exit", WHITE)
         screen.blit(info_text, (WIDTH//2 - info_text.get_width()//2, 670))
         
         # Weapon listings
@@ -438,19 +1311,19 @@ def show_shop():
                 text_color = LIGHT_GRAY
             
             entry_text = f"{i}. {weapon_name}{status} - ${weapon.cost if not weapon.purchased else 'OWNED'}"
-            text_surface = font.render(entry_text, True, text_color)
+            text_surface = text_cache.render(font, entry_text, text_color)
             screen.blit(text_surface, (WIDTH//2 - 350, y_offset))
             
             # Weapon stats
             stats_text = f"Dmg: {weapon.damage} | Fire Rate: {weapon.fire_rate/1000:.1f}s | Ammo: {weapon.ammo}"
-            stats_surface = font.render(stats_text, True, LIGHT_GRAY)
+            stats_surface = text_cache.render(font, stats_text, LIGHT_GRAY)
             screen.blit(stats_surface, (WIDTH//2 - 350, y_offset + 30))
             
             y_offset += 80
 
         # Display popup message if active
         if popup_message and pygame.time.get_ticks() - popup_start_time < POPUP_DURATION:
-            popup_surface = font.render(popup_message, True, RED)
+            popup_surface = text_cache.render(font, popup_message, RED)
             popup_rect = popup_surface.get_rect(center=(WIDTH//2, HEIGHT - 100))
             pygame.draw.rect(screen, BLACK, (popup_rect.x-10, popup_rect.y-5, 
                            popup_rect.width+20, popup_rect.height+10))
@@ -478,59 +1351,158 @@ def show_shop():
                 if event.key == pygame.K_3:
                     handle_weapon_selection("Sniper", weapons["Sniper"])
 
-class BloodParticle(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.size = random.randint(3, 7)
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        
-        # Blood color variations
-        blood_colors = [
-            (200, 0, 0),    # Dark red
-            (150, 0, 0),    # Deeper red
-            (255, 50, 50),  # Bright red
-            (180, 30, 30)  # Medium red
-        ]
-        pygame.draw.circle(self.image, random.choice(blood_colors), 
-                          (self.size//2, self.size//2), self.size//2)
-        
-        self.rect = self.image.get_rect(center=(x, y))
-        
-        self.velocity = pygame.math.Vector2(
-            random.uniform(-3, 3),
-            random.uniform(-3, 0)
-        )
-            
-        self.gravity = 0.2
-        self.lifetime = random.randint(800, 1200)
-        self.spawn_time = pygame.time.get_ticks()
-        self.alpha = 255
+# Blood particles kept in fixed size arrays, slots of dead particles are reused by the next spawn
+class ParticleSystem:
+    gravity = 0.2
+
+    # Blood color variations
+    colors = [
+        (200, 0, 0),    # Dark red
+        (150, 0, 0),    # Deeper red
+        (255, 50, 50),  # Bright red
+        (180, 30, 30)  # Medium red
+    ]
+    sizes = range(3, 8)
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, alpha_steps=PARTICLE_ALPHA_STEPS, use_numpy=USE_NUMPY_PARTICLES):
+        self.capacity = capacity
+        self.alpha_steps = alpha_steps
+        self.use_numpy = use_numpy and np is not None
+        if self.use_numpy:
+            self.x = np.zeros(capacity)
+            self.y = np.zeros(capacity)
+            self.vx = np.zeros(capacity)
+            self.vy = np.zeros(capacity)
+            self.spawn_time = np.zeros(capacity)
+            self.lifetime = np.ones(capacity)
+            self.sprite = np.zeros(capacity, dtype=np.int32)
+            self.alive = np.zeros(capacity, dtype=bool)
+        else:
+            self.x = [0.0] * capacity
+            self.y = [0.0] * capacity
+            self.vx = [0.0] * capacity
+            self.vy = [0.0] * capacity
+            self.spawn_time = [0] * capacity
+            self.lifetime = [1] * capacity
+            self.sprite = [0] * capacity
+            self.alive = [False] * capacity
+        self.free = list(range(capacity - 1, -1, -1))  # Free slots, lowest index on top
+        self.dropped = 0  # Spawns skipped because every slot was taken
+        self.sprites = self.create_sprites()
+
+    def create_sprites(self):
+        # Index = (size * colors + color) * alpha_steps + alpha step, alpha step 0 is the most faded
+        sprites = []
+        for size in self.sizes:
+            for color in self.colors:
+                dot = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(dot, color, (size//2, size//2), size//2)
+                for step in range(self.alpha_steps):
+                    faded = dot.copy()
+                    faded.set_alpha(255 * (step + 1) // self.alpha_steps)
+                    sprites.append(faded)
+        return sprites
+
+    def spawn(self, x, y, count):
+        now = pygame.time.get_ticks()
+        for _ in range(count):
+            if not self.free:
+                self.dropped += 1
+                continue
+            slot = self.free.pop()
+            size_index = random.randrange(len(self.sizes))
+            size = self.sizes[size_index]
+            self.x[slot] = x - size // 2
+            self.y[slot] = y - size // 2
+            self.vx[slot] = random.uniform(-3, 3)
+            self.vy[slot] = random.uniform(-3, 0)
+            self.spawn_time[slot] = now
+            self.lifetime[slot] = random.randint(800, 1200)
+            self.sprite[slot] = (size_index * len(self.colors) + random.randrange(len(self.colors))) * self.alpha_steps
+            self.alive[slot] = True
 
     def update(self):
-        # Apply gravity
-        self.velocity.y += self.gravity
-        
-        # Update position
-        self.rect.x += self.velocity.x
-        self.rect.y += self.velocity.y
-        
-        # Fade out
-        elapsed = pygame.time.get_ticks() - self.spawn_time
-        if elapsed > self.lifetime / 2:
-            self.alpha = max(0, 255 - int(255 * (elapsed / self.lifetime)))
-            self.image.set_alpha(self.alpha)
-        
-        if elapsed > self.lifetime:
-            self.kill()
+        now = pygame.time.get_ticks()
+        if self.use_numpy:
+            alive = self.alive
+            self.vy[alive] += self.gravity
+            self.x[alive] += self.vx[alive]
+            self.y[alive] += self.vy[alive]
+            expired = alive & (now - self.spawn_time > self.lifetime)
+            if expired.any():
+                alive[expired] = False
+                self.free.extend(np.flatnonzero(expired).tolist())
+            return
+
+        for slot in range(self.capacity):
+            if not self.alive[slot]:
+                continue
+            self.vy[slot] += self.gravity
+            self.x[slot] += self.vx[slot]
+            self.y[slot] += self.vy[slot]
+            if now - self.spawn_time[slot] > self.lifetime[slot]:
+                self.alive[slot] = False
+                self.free.append(slot)
+
+    def draw(self, screen):
+        # Full alpha for the first half of the lifetime, then fading out, in alpha_steps steps
+        now = pygame.time.get_ticks()
+        steps = self.alpha_steps
+        if self.use_numpy:
+            slots = np.flatnonzero(self.alive)
+            age = (now - self.spawn_time[slots]) / self.lifetime[slots]
+            fade = np.where(age > 0.5, 1 - age, 1.0)
+            step = np.clip(np.ceil(fade * steps).astype(np.int32) - 1, 0, steps - 1)
+            sprite_ids = (self.sprite[slots] + step).tolist()
+            xs = self.x[slots]
+            ys = self.y[slots]
+            positions = zip(xs.tolist(), ys.tolist())
+        else:
+            slots = [slot for slot in range(self.capacity) if self.alive[slot]]
+            sprite_ids = []
+            for slot in slots:
+                age = (now - self.spawn_time[slot]) / self.lifetime[slot]
+                fade = 1 - age if age > 0.5 else 1.0
+                sprite_ids.append(self.sprite[slot] + min(steps - 1, max(0, math.ceil(fade * steps) - 1)))
+            positions = [(self.x[slot], self.y[slot]) for slot in slots]
+        sprites = self.sprites
+        screen.blits([(sprites[sprite_id], position) for sprite_id, position in zip(sprite_ids, positions)], doreturn=False)
+
+        # Changed area as one rect per DIRTY_RECT_TILE tile a particle corner is on instead of one rect per particle
+        tile = DIRTY_RECT_TILE
+        extent = max(self.sizes) - 1
+        if self.use_numpy:
+            stride = WIDTH // tile + 1
+            left = np.clip(xs // tile, 0, stride - 1).astype(np.int32)
+            right = np.clip((xs + extent) // tile, 0, stride - 1).astype(np.int32)
+            top = np.clip(ys // tile, 0, None).astype(np.int32) * stride
+            bottom = np.clip((ys + extent) // tile, 0, None).astype(np.int32) * stride
+            cells = np.unique(np.concatenate((top + left, top + right, bottom + left, bottom + right)))
+            return [pygame.Rect(cell % stride * tile, cell // stride * tile, tile, tile) for cell in cells.tolist()]
+        cells = set()
+        for x, y in positions:
+            for corner_x in (x, x + extent):
+                for corner_y in (y, y + extent):
+                    cells.add((max(0, int(corner_x // tile)), max(0, int(corner_y // tile))))
+        return [pygame.Rect(column * tile, row * tile, tile, tile) for column, row in cells]
+
+    def clear(self):
+        for slot in range(self.capacity):
+            self.alive[slot] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+blood_particles = ParticleSystem()
 
 # Player class
 class Player(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
         self.weapon = weapons["Pistol"]
-        self.image = self.weapon.combined_image  
-        self.original_image = self.image  
-        self.mask = pygame.mask.from_surface(self.image)
+        self.original_image = self.weapon.combined_image  
+        self.image, self.mask = rotation_cache.rotate(self.original_image, 0)
         self.weapon = weapons["Pistol"]
         self.purchased_weapons = ["Pistol"]
 
@@ -594,8 +1566,8 @@ class Player(pygame.sprite.Sprite):
         rel_x, rel_y = mouse_x - self.true_position.x, mouse_y - self.true_position.y
         self.angle = math.degrees(-math.atan2(rel_y, rel_x))
         
-        # Rotate the image
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        # Rotate the image ( and its mask )
+        self.image, self.mask = rotation_cache.rotate(self.original_image, self.angle)
         
         # Calculate the offset after rotation
         offset_rotated = self.pivot_offset.rotate(-self.angle)
@@ -615,7 +1587,7 @@ class Player(pygame.sprite.Sprite):
         if weapon_name in self.purchased_weapons:
             self.weapon = weapons[weapon_name]
             self.original_image = self.weapon.combined_image
-            self.image = self.original_image
+            self.image, self.mask = rotation_cache.rotate(self.original_image, self.angle)
             self.rect = self.image.get_rect(center=self.rect.center)
             self.ammo = self.weapon.ammo
             self.is_reloading = False
@@ -642,12 +1614,11 @@ class Player(pygame.sprite.Sprite):
 
     def draw_ammo(self, screen):
         # Draw ammo counter
-        ammo_text = font.render(f"Ammo: {str(self.ammo) +"/"+ str(self.weapon.ammo)}", True, WHITE)
-        screen.blit(ammo_text, (WIDTH - 250, 10))
+        ammo_hud.draw(screen, (WIDTH - 250, 10))
         
         # Draw reload indicator
         if self.is_reloading:
-            reload_text = font.render("Reloading...", True, RED)
+            reload_text = text_cache.render(font, "Reloading...", RED)
             screen.blit(reload_text, (WIDTH - 250, 40))
             
             # Draw reload progress bar
@@ -661,6 +1632,9 @@ class Player(pygame.sprite.Sprite):
             pygame.draw.rect(screen, GREEN, 
                            (WIDTH - 200, 70, int(progress_width * progress), 10))
 
+        # Area the ammo counter and reload bar may cover
+        return pygame.Rect(WIDTH - 250, 10, 250, 70)
+
     def draw(self, screen):
         screen.blit(self.image, self.rect.topleft)
     
@@ -681,18 +1655,19 @@ class Player(pygame.sprite.Sprite):
             muzzle_x = self.rect.centerx + gun_length * direction.x
             muzzle_y = self.rect.centery + gun_length * direction.y
             
-            muzzle_flash = MuzzleFlash(muzzle_x, muzzle_y, 0)  
+            muzzle_flash = MuzzleFlash(muzzle_x, muzzle_y)  
             all_sprites.add(muzzle_flash)
 
             # Create 3 bullets with different directions
             if self.weapon.name == "Shotgun":
                 # Center bullet
-                center_bullet = Bullet(
+                center_bullet = bullet_pool.acquire(
                     self.rect.centerx, 
                     self.rect.centery,
                     direction, 
                     self.weapon.projectile_speed,
-                    self.weapon.max_range
+                    self.weapon.max_range,
+                    self.weapon.pierce
                 )
                 all_sprites.add(center_bullet)
                 bullets.add(center_bullet)
@@ -701,12 +1676,13 @@ class Player(pygame.sprite.Sprite):
                 left_direction = pygame.math.Vector2(-direction.y, direction.x) * 0.3 + direction
                 left_direction = left_direction.normalize()
                 
-                left_bullet = Bullet(
+                left_bullet = bullet_pool.acquire(
                     self.rect.centerx, 
                     self.rect.centery,
                     left_direction, 
                     self.weapon.projectile_speed,
-                    self.weapon.max_range
+                    self.weapon.max_range,
+                    self.weapon.pierce
                 )
                 all_sprites.add(left_bullet)
                 bullets.add(left_bullet)
@@ -715,23 +1691,25 @@ class Player(pygame.sprite.Sprite):
                 right_direction = pygame.math.Vector2(direction.y, -direction.x) * 0.3 + direction
                 right_direction = right_direction.normalize()
                 
-                right_bullet = Bullet(
+                right_bullet = bullet_pool.acquire(
                     self.rect.centerx, 
                     self.rect.centery,
                     right_direction, 
                     self.weapon.projectile_speed,
-                    self.weapon.max_range
+                    self.weapon.max_range,
+                    self.weapon.pierce
                 )
                 all_sprites.add(right_bullet)
                 bullets.add(right_bullet)
             else:
                 # Regular single bullet for other weapons
-                bullet = Bullet(
+                bullet = bullet_pool.acquire(
                     self.rect.centerx, 
                     self.rect.centery,
                     direction, 
                     self.weapon.projectile_speed,
-                    self.weapon.max_range
+                    self.weapon.max_range,
+                    self.weapon.pierce
                 )
                 all_sprites.add(bullet)
                 bullets.add(bullet)
@@ -746,22 +1724,23 @@ class Player(pygame.sprite.Sprite):
                 self.start_reload()
 
 # MuzzleFlasash class
-class MuzzleFlash(pygame.sprite.Sprite):
-    def __init__(self, x, y, angle):
-        super().__init__()
-        self.alpha = 255
-        self.layers = []
-        
+# Randomized muzzle flashes drawn once at startup, each as a list of pre-scaled and pre-faded animation frames
+class MuzzleFlashAtlas:
+    def __init__(self, variants=MUZZLE_FLASH_VARIANTS, frames=MUZZLE_FLASH_FRAMES):
+        self.frame_count = frames
+        self.variants = [self.create_frames(self.create_flash()) for _ in range(variants)]
+
+    def create_flash(self):
         # Generate random flash characteristics
         flash_size = random.randint(20, 30)
         spike_length = random.randint(8, 15)
         
         # Create main flash surface
-        self.image = pygame.Surface((flash_size * 2, flash_size * 2), pygame.SRCALPHA)
+        image = pygame.Surface((flash_size * 2, flash_size * 2), pygame.SRCALPHA)
         
         # Add bright core
-        core_color = (255, 255, 150, self.alpha)
-        pygame.draw.circle(self.image, core_color, 
+        core_color = (255, 255, 150, 255)
+        pygame.draw.circle(image, core_color, 
                           (flash_size, flash_size), 
                           random.randint(3, 5))
         
@@ -777,7 +1756,7 @@ class MuzzleFlash(pygame.sprite.Sprite):
             (0.707, -0.707),
         ]
 
-        spike_color = (255, 180, 50, self.alpha)
+        spike_color = (255, 180, 50, 255)
         for i in range(len(unit_vectors)):
             dx, dy = unit_vectors[i]
             start_x = flash_size + dx * 5
@@ -785,7 +1764,7 @@ class MuzzleFlash(pygame.sprite.Sprite):
             end_x = flash_size + dx * spike_length
             end_y = flash_size + dy * spike_length
             pygame.draw.line(
-                self.image, spike_color,
+                image, spike_color,
                 (start_x, start_y), (end_x, end_y),
                 random.randint(2, 4)
             )
@@ -796,77 +1775,162 @@ class MuzzleFlash(pygame.sprite.Sprite):
                 flash_size + random.randint(-10, 10),
                 flash_size + random.randint(-10, 10)
             )
-            pygame.draw.circle(self.image, smoke_color,
+            pygame.draw.circle(image, smoke_color,
                              smoke_pos, random.randint(1, 2))
 
-        # Apply transformations
-        self.image = pygame.transform.rotate(self.image, -angle + random.randint(-15, 15))
-        self.rect = self.image.get_rect(center=(x, y))
+        return pygame.transform.rotate(image, random.randint(-15, 15))
+
+    def create_frames(self, image):
+        # Grows to 1.5x while fading out, every frame scaled from the sharp original
+        frames = []
+        for index in range(self.frame_count):
+            progress = index / self.frame_count
+            scale = 1.0 + 0.5 * progress
+            frame = pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+            frame.set_alpha(255 - int(255 * progress))
+            frames.append(frame)
+        return frames
+
+muzzle_flash_atlas = MuzzleFlashAtlas()
+
+class MuzzleFlash(pygame.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.center = (x, y)  # Spikes point every way, so the flash is drawn unrotated
+        self.variant = random.randrange(len(muzzle_flash_atlas.variants))
+        self.frame = -1
         
         # Animation properties
         self.spawn_time = pygame.time.get_ticks()
         self.duration = 120  # milliseconds
+        self.set_frame(0)
+
+    def set_frame(self, frame):
+        if frame == self.frame:
+            return
+        self.frame = frame
+        self.image = muzzle_flash_atlas.variants[self.variant][frame]
+        self.rect = self.image.get_rect(center=self.center)
 
     def update(self):
-        # Calculate fade progression
+        # Step through the baked frames by elapsed time
         elapsed = pygame.time.get_ticks() - self.spawn_time
-        progress = elapsed / self.duration
-        
-        # Update alpha and scale
-        self.alpha = max(0, 255 - int(255 * progress))
-        self.image.set_alpha(self.alpha)
-        
-        # Add scaling effect
-        current_scale = 1.0 + 0.5 * progress
-        scaled_image = pygame.transform.scale(self.image,
-            (int(self.rect.width * current_scale),
-            int(self.rect.height * current_scale)))
-        self.image = scaled_image
-        
         if elapsed > self.duration:
             self.kill()
+            return
+        self.set_frame(min(muzzle_flash_atlas.frame_count - 1, elapsed * muzzle_flash_atlas.frame_count // self.duration))
+
+# Projectile sprites are recycled, kill() hands them back to their pool instead of leaving them to the garbage collector
+class ProjectilePool:
+    def __init__(self, projectile_class, capacity):
+        self.projectile_class = projectile_class
+        self.capacity = capacity  # Max idle projectiles kept, more can be in flight
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        for _ in range(capacity):
+            self.free.append(self.create())
+
+    def create(self):
+        projectile = self.projectile_class()
+        projectile.pool = self
+        self.created += 1
+        return projectile
+
+    def acquire(self, *args):
+        if self.free:
+            projectile = self.free.pop()
+            self.reused += 1
+        else:
+            projectile = self.create()
+        projectile.reset(*args)
+        self.in_use += 1
+        return projectile
+
+    def release(self, projectile):
+        self.in_use -= 1
+        if len(self.free) < self.capacity:
+            self.free.append(projectile)
+
+    def stats(self):
+        return f"{self.in_use} in use, {len(self.free)} free, {self.created} created, {self.reused} reused"
+
+class PooledProjectile(pygame.sprite.Sprite):
+    pool = None
+
+    def kill(self):
+        # Only the first kill returns the projectile, it may be killed again later in the same frame
+        if self.alive():
+            super().kill()
+            if self.pool is not None:
+                self.pool.release(self)
 
 # Bullet class
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, direction, speed, max_range):
+class Bullet(PooledProjectile):
+    width = 15
+    height = 8
+
+    # Create bullet image, shared by every bullet
+    image = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(image, YELLOW, (0, 0, width, height))
+    pygame.draw.rect(image, BLACK, (0, 0, width, height), 2)
+
+    def __init__(self):
         super().__init__()
+        self.rect = self.image.get_rect()
+        self.hit_zombies = set()  # Zombies already hit, a piercing bullet damages each only once
+
+    def reset(self, x, y, direction, speed, max_range, pierce=0):
         self.speed = speed
         self.max_distance = max_range
         self.distance_traveled = 0
-        self.width = 15
-        self.height = 8
-
-        # Create bullet image
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, YELLOW, (0, 0, self.width, self.height))
-        pygame.draw.rect(self.image, BLACK, (0, 0, self.width, self.height), 2)
-        
-        self.rect = self.image.get_rect(center=(x, y))
+        self.pierce = pierce
+        self.hit_zombies.clear()
+        self.rect.center = (x, y)
+        self.prev_center = self.rect.center  # Start of this frame's movement, for swept hits
+        self.sweep_end = self.rect.center  # End of the movement that can still hit, short of a wall or the max range
+        self.spent = False  # Hit a wall or ran out of range, killed once handle_bullet_hits resolved its last segment
         self.direction = direction
 
     def update(self):
         # Move bullet in its direction
+        self.prev_center = self.rect.center
         self.rect.x += self.direction.x * self.speed
         self.rect.y += self.direction.y * self.speed
         self.distance_traveled += self.speed
+        self.sweep_end = self.rect.center
 
         for wall in MONUMENT_WALLS:
                     if self.rect.colliderect(wall):
-                        self.kill()
+                        # Only the movement up to the wall can hit
+                        clipped = wall.inflate(self.rect.width, self.rect.height).clipline(self.prev_center, self.rect.center)
+                        if clipped:
+                            self.sweep_end = clipped[0]
+                        self.spent = True
                         return
                     
         # Check if bullet exceeded max range or left screen
-        if (self.max_distance is not None and self.distance_traveled > self.max_distance) or \
-           not screen.get_rect().colliderect(self.rect):
-            self.kill()
+        if self.max_distance is not None and self.distance_traveled > self.max_distance:
+            # Only the part of the last step within range can hit
+            keep = 1 - (self.distance_traveled - self.max_distance) / self.speed
+            self.sweep_end = (self.prev_center[0] + (self.rect.centerx - self.prev_center[0]) * keep,
+                              self.prev_center[1] + (self.rect.centery - self.prev_center[1]) * keep)
+            self.spent = True
+        elif not screen.get_rect().colliderect(self.rect):
+            self.spent = True
+
+class SpitProjectile(PooledProjectile):
+    image = pygame.Surface((10, 10))
+    image.fill(PURPLE)
 
-class SpitProjectile(pygame.sprite.Sprite):
-    def __init__(self, x, y, direction):
+    def __init__(self):
         super().__init__()
-        self.image = pygame.Surface((10, 10))
-        self.image.fill(PURPLE)
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect = self.image.get_rect()
         self.speed = 5
+
+    def reset(self, x, y, direction):
+        self.rect.center = (x, y)
         self.direction = direction
 
     def update(self):
@@ -874,22 +1938,24 @@ class SpitProjectile(pygame.sprite.Sprite):
         self.rect.y += self.direction.y * self.speed
         if not screen.get_rect().colliderect(self.rect):
             self.kill()
-            spit_projectiles.remove(self)  # Remove from the projectiles group
+            return
 
         for wall in MONUMENT_WALLS:
             if self.rect.colliderect(wall):
                 self.kill()
-                spit_projectiles.remove(self)
                 return
 
+bullet_pool = ProjectilePool(Bullet, BULLET_POOL_SIZE)
+spit_pool = ProjectilePool(SpitProjectile, SPIT_POOL_SIZE)
+
 # Zombie class
 class Zombie(pygame.sprite.Sprite):
     def __init__(self, x, y, image_path):
         super().__init__()
-        self.original_image = pygame.image.load("Images/" + image_path).convert_alpha()
-        self.image = self.original_image  # Default image without rotation
+        self.original_image = assets.image("Images/" + image_path)  # Preloaded, shared by all zombies of one type
+        self.image_key = image_path  # Zombies of one type share their rotations
+        self.image, self.mask = rotation_cache.rotate(self.original_image, 0, self.image_key)  # Default image without rotation
         self.rect = self.image.get_rect(center=(x, y))
-        self.mask = pygame.mask.from_surface(self.image)
         self.path_update_interval = random.randint(300, 500)  
         self.current_target_index = 0
         self.path = []
@@ -899,6 +1965,8 @@ class Zombie(pygame.sprite.Sprite):
         self.has_active_path = True
         self.stuck_timer = 0
         self.max_stuck_time = 5000
+        self.angle = 0
+        self.path_future = None  # Path being searched in the background
         
         # Add a circular collision radius for distance checks
         self.collision_radius = self.rect.width // 2
@@ -925,21 +1993,13 @@ class Zombie(pygame.sprite.Sprite):
     def update(self):
         current_time = pygame.time.get_ticks()
         
-        # Update path periodically or if current path is empty
-        if (current_time - self.path_update_timer > self.path_update_interval or 
+        # Pick up a path searched in the background
+        self.poll_path()
+
+        # Ask for a new path periodically or if current path is empty, keep the old one until it's served
+        if self.path_future is None and (current_time - self.path_update_timer > self.path_update_interval or 
             not self.path or self.current_target_index >= len(self.path)):
-            old_has_path = bool(self.path)
-            self.path_update_timer = current_time
-            self.update_path()
-            
-            # Update stuck timer based on path status
-            if self.path:
-                self.has_active_path = True
-                self.stuck_timer = 0
-            else:
-                self.has_active_path = False
-                if old_has_path:  # Only start timer if we just lost our path
-                    self.stuck_timer = current_time
+            path_scheduler.request(self)
         
         # Check if zombie is stuck without a path for too long
         if not self.has_active_path and self.stuck_timer > 0:
@@ -947,12 +2007,6 @@ class Zombie(pygame.sprite.Sprite):
                 self.kill()
                 return
         
-        # Update path periodically or if current path is empty
-        if (current_time - self.path_update_timer > self.path_update_interval or 
-            not self.path or self.current_target_index >= len(self.path)):
-            self.path_update_timer = current_time
-            self.update_path()
-        
         # Follow path if we have one
         if self.path and self.current_target_index < len(self.path):
             target_pos = pygame.math.Vector2(self.path[self.current_target_index])
@@ -970,8 +2024,9 @@ class Zombie(pygame.sprite.Sprite):
             if pygame.math.Vector2(self.rect.center).distance_to(target_pos) < 10:
                 self.current_target_index += 1
         
-        # Avoid other zombies
-        self.avoid_collisions()
+        # Avoid other zombies ( done for everyone at once in main when batched )
+        if not USE_BATCH_SEPARATION:
+            self.avoid_collisions()
         
         # Rotate to face movement direction
         if self.path and self.current_target_index < len(self.path):
@@ -979,7 +2034,7 @@ class Zombie(pygame.sprite.Sprite):
             rel_x, rel_y = target_pos.x - self.rect.centerx, target_pos.y - self.rect.centery
             self.angle = math.degrees(-math.atan2(rel_y, rel_x))
         
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        self.image, self.mask = rotation_cache.rotate(self.original_image, self.angle, self.image_key)
         self.rect = self.image.get_rect(center=self.rect.center)
         
     
@@ -987,12 +2042,11 @@ class Zombie(pygame.sprite.Sprite):
         if not DEBUG_MODE:
             player_dist = pygame.math.Vector2(player.rect.center).distance_to(self.rect.center)
             if player_dist < self.collision_radius + player.collision_radius:
-                offset_x = player.rect.left - self.rect.left
-                offset_y = player.rect.top - self.rect.top
+                # Where our mask sits relative to the player's
+                offset_x = self.rect.left - player.rect.left
+                offset_y = self.rect.top - player.rect.top
                 if player.mask.overlap(self.mask, (offset_x, offset_y)):
-                    for _ in range(random.randint(8, 15)):
-                        particle = BloodParticle(player.rect.centerx, player.rect.centery)
-                        all_sprites.add(particle)
+                    blood_particles.spawn(player.rect.centerx, player.rect.centery, random.randint(8, 15))
                     if player_health.take_damage(1):  
                         play_death_animation()
                     
@@ -1004,15 +2058,17 @@ class Zombie(pygame.sprite.Sprite):
 
     def avoid_collisions(self):
         # Reset push vector each frame
-        self.push_vector = pygame.math.Vector2(0, 0)
+        push_x, push_y = 0, 0
         neighbor_count = 0
+        center_x, center_y = self.rect.center
         
-        # Check against other zombies
-        for other in zombies:
-            if other != self:
+        # Check against nearby zombies only
+        for other in zombie_hash.query(self.rect.center, self.avoidance_radius + SPATIAL_HASH_MARGIN):
+            if other is not self and other.alive():
                 # Calculate distance between centers
-                dist_vec = pygame.math.Vector2(other.rect.center) - pygame.math.Vector2(self.rect.center)
-                distance = dist_vec.length()
+                dx = other.rect.centerx - center_x
+                dy = other.rect.centery - center_y
+                distance = math.hypot(dx, dy)
                 
                 # Calculate combined collision radius
                 min_distance = self.collision_radius + other.collision_radius
@@ -1021,8 +2077,8 @@ class Zombie(pygame.sprite.Sprite):
                     # Calculate separation force (stronger when closer)
                     if distance > 0:
                         force = (self.avoidance_radius - distance) / self.avoidance_radius
-                        separation = -dist_vec.normalize() * force
-                        self.push_vector += separation
+                        push_x -= dx / distance * force
+                        push_y -= dy / distance * force
                         neighbor_count += 1
                     
                     # Handle direct collisions
@@ -1031,14 +2087,17 @@ class Zombie(pygame.sprite.Sprite):
                         if overlap > 0:
                             # Calculate push direction and amount
                             if distance > 0:
-                                push_dir = dist_vec.normalize()
+                                push_dir_x, push_dir_y = dx / distance, dy / distance
                             else:
-                                push_dir = pygame.math.Vector2(1, 0)  # Default if same position
+                                push_dir_x, push_dir_y = 1, 0  # Default if same position
                             
                             # Push away based on overlap
                             push_amount = overlap * 0.5
-                            self.push_vector += -push_dir * push_amount
+                            push_x -= push_dir_x * push_amount
+                            push_y -= push_dir_y * push_amount
         
+        self.push_vector = pygame.math.Vector2(push_x, push_y)
+
         # Apply averaged push force
         if neighbor_count > 0:
             self.push_vector /= neighbor_count
@@ -1048,13 +2107,45 @@ class Zombie(pygame.sprite.Sprite):
             self.rect.center += self.push_vector * self.avoidance_force
             self.push_vector *= self.push_decay
 
-    def update_path(self):
-        global pathfinding_grid
+    # Called by the path scheduler when it's this zombie's turn
+    def refresh_path(self):
+        self.path_update_timer = pygame.time.get_ticks()
+        self.update_path()
+
+    def set_path(self, path):
+        current_time = pygame.time.get_ticks()
+        old_has_path = bool(self.path)
+        self.path = path
+        self.current_target_index = 0
         
-        # Update zombie positions in pathfinding grid
-        pathfinding_grid.update_zombie_positions(zombies)
+        # Update stuck timer based on path status
+        if self.path:
+            self.has_active_path = True
+            self.stuck_timer = 0
+        else:
+            self.has_active_path = False
+            if old_has_path:  # Only start timer if we just lost our path
+                self.stuck_timer = current_time
+
+    def request_path(self, start_pos, end_pos):
+        self.path_future = path_service.submit(start_pos, end_pos)
+        self.poll_path()
+
+    def poll_path(self):
+        if self.path_future is None or not self.path_future.done():
+            return
+        path = path_service.result(self.path_future)
+        self.path_future = None
+        if path is None:
+            self.path_update_timer = 0  # Grid changed during the search, ask again next frame
+            return
         
+        # An empty path already was searched from the nearest walkable cells ( path_nodes ), set_path starts the stuck timer
+        self.set_path(path)
+
+    def update_path(self):
         # Get new path - use screen center if player is None (shouldn't happen but just in case)
+        # Zombie positions in the grid are updated once per frame in main
         target_pos = player.rect.center if hasattr(player, 'rect') else (WIDTH//2, HEIGHT//2)
         
         # If zombie is outside screen, first path to screen edge
@@ -1066,36 +2157,23 @@ class Zombie(pygame.sprite.Sprite):
             edge_target = (target_x, target_y)
             
             # Get path to screen edge first
-            self.path = pathfinding_grid.find_path(self.rect.center, edge_target)
+            self.request_path(self.rect.center, edge_target)
+            return
+
+        direct_path = pathfinding_grid.direct_path(self.rect.center, target_pos) if PATH_SMOOTHING else None
+        if direct_path:
+            # Player in plain sight, no need for a path
+            self.set_path(direct_path)
+        elif pathfinding_grid.use_flow_field:
+            # Read the next steps from the shared flow field
+            self.set_path(pathfinding_grid.flow_path(self.rect.center, target_pos))
         else:
             # Normal path to player
-            self.path = pathfinding_grid.find_path(self.rect.center, target_pos)
-            
-        self.current_target_index = 0
-        
-        # If no path found, try again with adjusted positions
-        if not self.path:
-            adjusted_start = pathfinding_grid.find_nearest_walkable(
-                self.rect.centerx // GRID_SIZE,
-                self.rect.centery // GRID_SIZE
-            )
-            adjusted_start = (adjusted_start[0] * GRID_SIZE + GRID_SIZE//2,
-                            adjusted_start[1] * GRID_SIZE + GRID_SIZE//2)
-            
-            adjusted_target = pathfinding_grid.find_nearest_walkable(
-                target_pos[0] // GRID_SIZE,
-                target_pos[1] // GRID_SIZE
-            )
-            adjusted_target = (adjusted_target[0] * GRID_SIZE + GRID_SIZE//2,
-                            adjusted_target[1] * GRID_SIZE + GRID_SIZE//2)
-            
-            self.path = pathfinding_grid.find_path(adjusted_start, adjusted_target)
-            self.current_target_index = 0
+            self.request_path(self.rect.center, target_pos)
 
 class TankZombie(Zombie):
     def __init__(self, x, y, image_path):
         super().__init__(x, y, image_path)
-        self.mask = pygame.mask.from_surface(self.image)
         self.base_speed = 0.8
         self.max_health = 150 + (zombie_wave * 15)
         self.health = self.max_health
@@ -1110,7 +2188,6 @@ class TankZombie(Zombie):
 class RunnerZombie(Zombie):
     def __init__(self, x, y, image_path):
         super().__init__(x, y, image_path)
-        self.mask = pygame.mask.from_surface(self.image)
         self.base_speed = 3.20
         self.max_health = 30 + (zombie_wave * 5)
         self.health = self.max_health
@@ -1125,7 +2202,6 @@ class RunnerZombie(Zombie):
 class SpitterZombie(Zombie):
     def __init__(self, x, y, image_path):
         super().__init__(x, y, image_path)
-        self.mask = pygame.mask.from_surface(self.image)
         self.base_speed = 1.0
         self.max_health = 80 + (zombie_wave * 8)
         self.health = self.max_health
@@ -1151,11 +2227,14 @@ class SpitterZombie(Zombie):
         player_center = pygame.math.Vector2(player.rect.center)
         zombie_center = pygame.math.Vector2(self.rect.center)
         
-        # Calculate the direction vector
-        direction = (player_center - zombie_center).normalize()
+        # Calculate the direction vector ( direct chase can put us right on the player )
+        direction = player_center - zombie_center
+        if direction.length() == 0:
+            return
+        direction = direction.normalize()
         
         # Create and add the spit projectile
-        spit = SpitProjectile(self.rect.centerx, self.rect.centery, direction)
+        spit = spit_pool.acquire(self.rect.centerx, self.rect.centery, direction)
         spitter_attack_sound.play()
         all_sprites.add(spit)
         spit_projectiles.add(spit)
@@ -1167,6 +2246,11 @@ class Farm:
         self.seed_planted = None
         self.stalks = []  # Store positions and growth stages of individual wheat stalks
 
+        # Soil plus room for the grown stalks reaching above it, rendered off screen and redrawn only when the crop changes
+        self.layer_rect = pygame.Rect(self.rect.left, self.rect.top - FARM_STALK_HEIGHT, self.rect.width, self.rect.height + FARM_STALK_HEIGHT)
+        self.layer = pygame.Surface(self.layer_rect.size, pygame.SRCALPHA)
+        self.layer_stage = -1  # Growth stage the layer was drawn for, -1 = needs redraw
+
     def plant_seed(self):
         if self.seed_planted is None:
             self.seed_planted = pygame.time.get_ticks()
@@ -1176,7 +2260,9 @@ class Farm:
             for _ in range(20):  # Number of wheat stalks
                 x = random.randint(self.rect.left + 10, self.rect.right - 10)
                 y = random.randint(self.rect.top + 10, self.rect.bottom - 10)
-                self.stalks.append({"pos": (x, y), "growth": 0})
+                grains = [(random.randint(-5, 5), random.randint(-5, 5)) for _ in range(5)]  # Fixed so the ripe crop doesn't flicker
+                self.stalks.append({"pos": (x, y), "growth": 0, "grains": grains})
+            self.layer_stage = -1
 
     def harvest_seed(self):
         global player_money
@@ -1187,47 +2273,60 @@ class Farm:
                 player_money += random.randint(10, 20)
                 self.seed_planted = None
                 self.stalks = []  # Clear the stalks after harvesting
+                self.layer_stage = -1
                 crop_harvested_sound.play()
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, BROWN, self.rect)  # Draw the farm soil
-        if self.seed_planted:
-            current_time = pygame.time.get_ticks()
-            time_elapsed = (current_time - self.seed_planted) / 1000
-            growth_percentage = min(time_elapsed / 15, 1.0)  # Growth percentage (0 to 1)
-
+    def growth_stage(self):
+        # Stalk height in pixels, the drawing only changes when this does
+        if not self.seed_planted:
+            return None
+        time_elapsed = (pygame.time.get_ticks() - self.seed_planted) / 1000
+        growth_percentage = min(time_elapsed / 15, 1.0)  # Growth percentage (0 to 1)
+        return int(FARM_STALK_HEIGHT * growth_percentage)
+
+    def render_layer(self, stalk_height):
+        layer = self.layer
+        layer.fill((0, 0, 0, 0))
+        offset_x, offset_y = self.layer_rect.topleft
+        pygame.draw.rect(layer, BROWN, self.rect.move(-offset_x, -offset_y))  # Draw the farm soil
+        if stalk_height is not None:
             for stalk in self.stalks:
                 x, y = stalk["pos"]
-                stalk_height = int(40 * growth_percentage)  # Height of the stalk
+                x -= offset_x
+                y -= offset_y
                 stalk_width = 2  # Width of the stalk
                 stem_color = (34, 139, 34)  # Color for the stem
 
                 # Draw the stem
                 stem_top = y - stalk_height
                 stem_bottom = y
-                pygame.draw.line(screen, stem_color, (x, stem_bottom), (x, stem_top), stalk_width)
+                pygame.draw.line(layer, stem_color, (x, stem_bottom), (x, stem_top), stalk_width)
 
                 # Draw the wheat grains at the top of the stalk
-                if growth_percentage >= 1.0:  # Fully grown
+                if stalk_height >= FARM_STALK_HEIGHT:  # Fully grown
                     grain_color = (PURPLE)
                     grain_radius = 3
-                    num_grains = 5  # Number of grains per stalk
-                    for i in range(num_grains):
-                        grain_x = x + random.randint(-5, 5)
-                        grain_y = stem_top + random.randint(-5, 5)
-                        pygame.draw.circle(screen, grain_color, (grain_x, grain_y), grain_radius)
+                    for grain_dx, grain_dy in stalk["grains"]:
+                        pygame.draw.circle(layer, grain_color, (x + grain_dx, stem_top + grain_dy), grain_radius)
 
                 # Draw the wheat head (a cluster of grains)
-                if growth_percentage >= 0.8:  # Partially grown
+                if stalk_height >= FARM_STALK_HEIGHT * 0.8:  # Partially grown
                     head_color = (PURPLE)  # Wheat head color
                     head_width = 10
                     head_height = 5
-                    pygame.draw.ellipse(screen, head_color, (x - head_width // 2, stem_top - head_height, head_width, head_height))
+                    pygame.draw.ellipse(layer, head_color, (x - head_width // 2, stem_top - head_height, head_width, head_height))
+        self.layer_stage = stalk_height
+
+    def draw(self, screen):
+        stage = self.growth_stage()
+        if stage != self.layer_stage:
+            self.render_layer(stage)
+        return screen.blit(self.layer, self.layer_rect)
         
 def show_start_menu():
     menu = [
-        pygame.image.load("Images/menu.jpg").convert_alpha(),
-        pygame.image.load("Images/menu1.jpg").convert_alpha()
+        assets.image("Images/menu.jpg"),
+        assets.image("Images/menu1.jpg")
     ]
     
     sound_track.play(loops=-1)
@@ -1262,7 +2361,7 @@ def show_start_menu():
 
 # Function to show the death screen
 def show_death_screen():
-    skull_surface = pygame.image.load("Images/death.png")
+    skull_surface = assets.image("Images/death.png").copy()  # Faded below, the registry's surface is shared
     
     skull_pos = (WIDTH//2 - 45, HEIGHT//2 - 150)
     
@@ -1339,6 +2438,7 @@ class HeartExplosion:
         self.heart_img = self.create_heart_image()
         self.particles = []
         self.light_beams = []
+        self.rotations = {}  # (piece index, snapped angle) -> rotated piece, only lives as long as this explosion
         
     def create_heart_image(self):
         # Create a pixel art heart surface
@@ -1409,7 +2509,6 @@ class HeartExplosion:
             particle['vel_y'] += 0.1  # Gravity
             particle['angle'] += particle['angle_vel']
             particle['alpha'] = max(0, particle['alpha'] - particle['fade_speed'])
-            particle['image'].set_alpha(particle['alpha'])
         
         return progress >= 1.0
     
@@ -1419,26 +2518,31 @@ class HeartExplosion:
         
         # Draw the whole heart before it breaks (first 20% of animation)
         if progress < 0.2:
-            scaled_heart = pygame.transform.scale(
-                self.heart_img,
-                (int(self.heart_img.get_width()),
-                 int(self.heart_img.get_height()))
-            )
-            heart_rect = scaled_heart.get_rect(center=(self.x, self.y))
-            screen.blit(scaled_heart, heart_rect)
+            heart_rect = self.heart_img.get_rect(center=(self.x, self.y))
+            screen.blit(self.heart_img, heart_rect)
         
         # Draw particles
-        for particle in self.particles:
+        for index, particle in enumerate(self.particles):
             if particle['alpha'] > 0:
-                rotated_piece = pygame.transform.rotate(particle['image'], particle['angle'])
+                rotated_piece = self.rotate_piece(index, particle['image'], particle['angle'])
+                rotated_piece.set_alpha(particle['alpha'])  # Only this fragment draws the piece, so no copy needed
                 piece_rect = rotated_piece.get_rect(center=(particle['x'], particle['y']))
                 screen.blit(rotated_piece, piece_rect.topleft)
 
+    def rotate_piece(self, index, piece, angle):
+        # Snapped like the sprite rotations, but kept out of the shared cache since no other sprite uses them
+        snapped = rotation_cache.snap(angle)
+        rotated = self.rotations.get((index, snapped))
+        if rotated is None:
+            rotated = pygame.transform.rotate(piece, snapped)
+            self.rotations[(index, snapped)] = rotated
+        return rotated
+
 def play_death_animation():
     global background
 
-    for spits in spit_projectiles:
-        spit_projectiles.remove(spits)
+    for spit in spit_projectiles:
+        spit.kill()
 
     background_music.stop()
 
@@ -1447,9 +2551,19 @@ def play_death_animation():
     # Create the heart explosion effect at player's position
     heart_explosion = HeartExplosion(player.rect.centerx, player.rect.centery)
     
+    # Freeze the scene once, fading it over the background looks the same as fading every sprite
+    scene = pygame.Surface((WIDTH, HEIGHT)).convert()
+    if background:
+        scene.blit(background, (0, 0))
+    else:
+        scene.fill(BLACK)
+    for sprite in all_sprites:
+        scene.blit(sprite.image, sprite.rect.topleft)
+    blood_particles.draw(scene)
+    
     # Create a darkening overlay
-    darken_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    darken_surface.fill((0, 0, 0, 0))
+    darken_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+    darken_surface.fill(BLACK)
     
     # Animation loop
     running = True
@@ -1473,17 +2587,14 @@ def play_death_animation():
             screen.fill(BLACK)
         
         # Draw game objects (fading out)
-        for sprite in all_sprites:
-            temp_img = sprite.image.copy()
-            temp_img.set_alpha(255 - int(255 * progress))
-            screen.blit(temp_img, sprite.rect.topleft)
+        scene.set_alpha(255 - int(255 * progress))
+        screen.blit(scene, (0, 0))
         
         # Draw heart explosion effect
         heart_explosion.draw(screen)
         
         # Darken screen progressively
-        darken_alpha = int(200 * progress)
-        darken_surface.fill((0, 0, 0, darken_alpha))
+        darken_surface.set_alpha(int(200 * progress))
         screen.blit(darken_surface, (0, 0))
         
         pygame.display.flip()
@@ -1502,6 +2613,8 @@ spit_projectiles = pygame.sprite.Group()
 bullets = pygame.sprite.Group()
 zombies = pygame.sprite.Group()
 farm = Farm()
+path_executor = create_path_executor()
+zombie_hash = SpatialHash()
 
 def spawn_zombie():
     global zombie_wave
@@ -1548,19 +2661,152 @@ def start_next_wave():
     time_spent_in_shop = 0  
     spawn_zombie()
 
+# Signed distance to the nearest grave/wall ( negative inside one ) plus the direction away from it, on a grid of samples
+class ObstacleField:
+    def __init__(self, rects, cell=OBSTACLE_FIELD_CELL, max_range=OBSTACLE_FIELD_RANGE):
+        self.cell = cell
+        self.columns = WIDTH // cell + 1
+        self.rows = HEIGHT // cell + 1
+        self.distance = [float(max_range)] * (self.columns * self.rows)  # Capped, far samples never push
+        self.grad_x = [0.0] * (self.columns * self.rows)
+        self.grad_y = [0.0] * (self.columns * self.rows)
+
+        # Outside: exact distance to the closest rect, only around each rect
+        inside = set()
+        near = set()
+        for rect in rects:
+            for row in range(max(0, (rect.top - max_range) // cell), min(self.rows, (rect.bottom + max_range) // cell + 1)):
+                y = row * cell
+                dy = max(rect.top - y, y - rect.bottom, 0)
+                for column in range(max(0, (rect.left - max_range) // cell), min(self.columns, (rect.right + max_range) // cell + 1)):
+                    x = column * cell
+                    i = row * self.columns + column
+                    near.add(i)
+                    if rect.collidepoint(x, y):
+                        inside.add(i)
+                    else:
+                        distance = math.hypot(max(rect.left - x, x - rect.right, 0), dy)
+                        if distance < self.distance[i]:
+                            self.distance[i] = distance
+
+        # Inside: distance to the nearest free sample, grown inwards from the edge of the union of rects
+        depth = {}
+        open_set = []
+        for i in inside:
+            row, column = divmod(i, self.columns)
+            for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
+                if not self.on_grid(column + dx, row + dy):
+                    continue  # Screen border, nothing to escape to
+                if (row + dy) * self.columns + column + dx not in inside:
+                    depth[i] = cell / 2  # The edge is between this sample and the free one
+                    heapq.heappush(open_set, (cell / 2, i))
+                    break
+        while open_set:
+            d, i = heapq.heappop(open_set)
+            if d > depth[i]:
+                continue  # Outdated queue entry
+            row, column = divmod(i, self.columns)
+            for dx, dy in [(0,1), (1,0), (0,-1), (-1,0), (1,1), (1,-1), (-1,1), (-1,-1)]:
+                if not self.on_grid(column + dx, row + dy):
+                    continue  # Would wrap around to the other side of the screen
+                n = (row + dy) * self.columns + column + dx
+                new_depth = d + (cell * 1.4 if dx and dy else cell)
+                if n in inside and (n not in depth or new_depth < depth[n]):
+                    depth[n] = new_depth
+                    heapq.heappush(open_set, (new_depth, n))
+        for i, d in depth.items():
+            self.distance[i] = -d
+
+        # Direction away from obstacles is where the distance goes up fastest ( central differences )
+        for i in near:
+            row, column = divmod(i, self.columns)
+            x1, x2 = max(column - 1, 0), min(column + 1, self.columns - 1)
+            y1, y2 = max(row - 1, 0), min(row + 1, self.rows - 1)
+            gx = (self.distance[row * self.columns + x2] - self.distance[row * self.columns + x1]) / (x2 - x1)
+            gy = (self.distance[y2 * self.columns + column] - self.distance[y1 * self.columns + column]) / (y2 - y1)
+            if gx == 0 and gy == 0 and self.distance[i] < max_range:
+                # On a ridge ( middle of a thin wall ) the differences cancel out, head to the highest neighbor instead
+                best = self.distance[i]
+                for dx, dy in [(0,1), (1,0), (0,-1), (-1,0), (1,1), (1,-1), (-1,1), (-1,-1)]:
+                    if self.on_grid(column + dx, row + dy) and self.distance[(row + dy) * self.columns + column + dx] > best:
+                        best = self.distance[(row + dy) * self.columns + column + dx]
+                        gx, gy = dx, dy
+            length = math.hypot(gx, gy)
+            if length:
+                self.grad_x[i] = gx / length
+                self.grad_y[i] = gy / length
+
+        # Flat spots ( thin gaps between touching rects ) still have no direction, point them at the closest sample that has one
+        flat = {i for i in near if self.distance[i] < max_range and not self.grad_x[i] and not self.grad_y[i]}
+        queue = deque(i for i in near if i not in flat)
+        while queue and flat:
+            i = queue.popleft()
+            row, column = divmod(i, self.columns)
+            for dx, dy in [(0,1), (1,0), (0,-1), (-1,0), (1,1), (1,-1), (-1,1), (-1,-1)]:
+                n = (row + dy) * self.columns + column + dx
+                if self.on_grid(column + dx, row + dy) and n in flat:
+                    flat.discard(n)
+                    length = math.hypot(dx, dy)
+                    self.grad_x[n] = -dx / length
+                    self.grad_y[n] = -dy / length
+                    queue.append(n)
+
+    def on_grid(self, column, row):
+        return 0 <= column < self.columns and 0 <= row < self.rows
+
+    def sample(self, x, y):
+        # Nearest sample, off screen positions use the closest edge sample
+        column = min(max(int(x / self.cell + 0.5), 0), self.columns - 1)
+        row = min(max(int(y / self.cell + 0.5), 0), self.rows - 1)
+        i = row * self.columns + column
+        return self.distance[i], self.grad_x[i], self.grad_y[i]
+
+obstacle_field = ObstacleField(COLLISION_RECTS)
+
+# Push an entity treated as a circle out of obstacles, returns the push to apply
+def obstacle_push(center, radius):
+    distance, grad_x, grad_y = obstacle_field.sample(*center)
+    depth = radius - distance
+    
+    # Same rule as the mask check, only push once about 20% of the circle is inside ( about half the radius deep )
+    if depth <= radius * 0.5:
+        return None
+    
+    # Push force proportional to how much of the entity is inside
+    push_force = 5 * min(1.0, depth / (radius * 2))
+    return pygame.math.Vector2(grad_x, grad_y) * push_force
+
 def handle_stuck_entities():
+    if PRECISE_STUCK_CHECK:
+        handle_stuck_entities_with_masks()
+        return
+
+    # Check player collision
+    push = obstacle_push(player.rect.center, player.collision_radius)
+    if push:
+        player.true_position += push
+        player.rect.center = player.true_position
+
+    # Check zombie collisions
+    for zombie in zombies:
+        push = obstacle_push(zombie.rect.center, zombie.collision_radius)
+        if push:
+            zombie.rect.center += push
+            zombie.collision_rect.center = zombie.rect.center
+
+# Solid masks for the collision objects, made once
+obstacle_masks = [pygame.mask.Mask(obj_rect.size, True) for obj_rect in COLLISION_RECTS]
+
+def handle_stuck_entities_with_masks():
 
     # Threshold ratio of overlapping pixels to total pixels (20%)
     OVERLAP_THRESHOLD = 0.2
     
     # Check player collision
-    player_mask = pygame.mask.from_surface(player.image)
+    player_mask = player.mask
     player_area = player_mask.count()
     
-    for obj_rect in COLLISION_RECTS:
-        # Create a mask for the collision object
-        obj_mask = pygame.mask.Mask(obj_rect.size, True)
-        
+    for obj_rect, obj_mask in zip(COLLISION_RECTS, obstacle_masks):
         # Calculate offset between player and object
         offset_x = obj_rect.left - player.rect.left
         offset_y = obj_rect.top - player.rect.top
@@ -1582,13 +2828,10 @@ def handle_stuck_entities():
     
     # Check zombie collisions
     for zombie in zombies:
-        zombie_mask = pygame.mask.from_surface(zombie.image)
+        zombie_mask = zombie.mask
         zombie_area = zombie_mask.count()
         
-        for obj_rect in COLLISION_RECTS:
-            # Create a mask for the collision object
-            obj_mask = pygame.mask.Mask(obj_rect.size, True)
-            
+        for obj_rect, obj_mask in zip(COLLISION_RECTS, obstacle_masks):
             # Calculate offset between zombie and object
             offset_x = obj_rect.left - zombie.rect.left
             offset_y = obj_rect.top - zombie.rect.top
@@ -1608,6 +2851,117 @@ def handle_stuck_entities():
                 zombie.rect.center += push_dir * push_force
                 zombie.collision_rect.center = zombie.rect.center
 
+# Same pushes as Zombie.avoid_collisions, for all zombies at once from this frame's positions
+def separate_zombies(zombies):
+    zombie_list = zombies.sprites()
+    count = len(zombie_list)
+    if count < 2:
+        return
+
+    # Columns: center x, center y, collision radius, avoidance radius, avoidance force, push decay
+    data = np.array([(z.rect.centerx, z.rect.centery, z.collision_radius, z.avoidance_radius,
+                      z.avoidance_force, z.push_decay) for z in zombie_list], dtype=float)
+    x, y, radius, avoid_radius, avoid_force, decay = data.T
+
+    # Cutoff neighbor search, bucket by the largest avoidance radius so neighbors are in the 3x3 buckets around
+    cell_size = avoid_radius.max()
+    cell_x = np.floor(x / cell_size).astype(np.int64)
+    cell_y = np.floor(y / cell_size).astype(np.int64)
+    cell_x -= cell_x.min() - 1
+    cell_y -= cell_y.min() - 1
+    stride = cell_y.max() + 2
+    keys = cell_x * stride + cell_y
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    pairs_i, pairs_j = [], []
+    for ox in (-1, 0, 1):
+        for oy in (-1, 0, 1):
+            neighbor_keys = (cell_x + ox) * stride + (cell_y + oy)
+            lo = np.searchsorted(sorted_keys, neighbor_keys, side="left")
+            hi = np.searchsorted(sorted_keys, neighbor_keys, side="right")
+            counts = hi - lo
+            total = counts.sum()
+            if total == 0:
+                continue
+            # Every zombie i paired with each zombie in the neighbor bucket
+            pairs_i.append(np.repeat(np.arange(count), counts))
+            group_starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+            pairs_j.append(order[np.arange(total) + group_starts])
+    i = np.concatenate(pairs_i)
+    j = np.concatenate(pairs_j)
+
+    dx = x[j] - x[i]
+    dy = y[j] - y[i]
+    distance = np.hypot(dx, dy)
+    near = (distance < avoid_radius[i]) & (i != j)  # Never ourselves
+    i, j, dx, dy, distance = i[near], j[near], dx[near], dy[near], distance[near]
+
+    moving = distance > 0
+    safe_distance = np.where(moving, distance, 1)
+    dir_x = np.where(moving, dx / safe_distance, 1)  # Default if same position
+    dir_y = np.where(moving, dy / safe_distance, 0)
+
+    # Separation force (stronger when closer)
+    force = np.where(moving, (avoid_radius[i] - distance) / avoid_radius[i], 0)
+    # Direct collisions, pushed away based on overlap
+    overlap = np.maximum(radius[i] + radius[j] - distance, 0) * 0.5
+    push_x = -np.bincount(i, weights=dir_x * (force + overlap), minlength=count)
+    push_y = -np.bincount(i, weights=dir_y * (force + overlap), minlength=count)
+
+    # Averaged push force
+    neighbor_count = np.maximum(np.bincount(i, weights=moving, minlength=count), 1)
+    push_x = push_x / neighbor_count
+    push_y = push_y / neighbor_count
+
+    # Write back, same as the per zombie version
+    for i, zombie in enumerate(zombie_list):
+        if push_x[i] or push_y[i]:
+            zombie.rect.center = (x[i] + push_x[i] * avoid_force[i], y[i] + push_y[i] * avoid_force[i])
+            zombie.push_vector = pygame.math.Vector2(push_x[i], push_y[i]) * decay[i]
+        else:
+            zombie.push_vector = pygame.math.Vector2(0, 0)
+
+# Bullets against zombies, along the whole distance each bullet moved this frame so fast ones can't skip a zombie
+def handle_bullet_hits():
+    for bullet in bullets:
+        start = bullet.prev_center
+        end = bullet.sweep_end
+
+        # Only zombies near the bullet's path, zombie_hash is from the start of the frame
+        mid = ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
+        reach = (math.hypot(end[0] - start[0], end[1] - start[1]) / 2 + zombie_hash.max_extent +
+                 max(bullet.rect.width, bullet.rect.height) / 2 + SPATIAL_HASH_MARGIN)
+
+        hits = []
+        for zombie in zombie_hash.query(mid, reach):
+            if not zombie.alive() or zombie in bullet.hit_zombies:
+                continue
+            # Moving bullet rect vs zombie rect is the bullet center's path vs the zombie rect grown by the bullet size
+            hit_rect = zombie.rect.inflate(bullet.rect.width, bullet.rect.height)
+            clipped = hit_rect.clipline(start, end)
+            if clipped:
+                entry = clipped[0]
+                hits.append(((entry[0] - start[0]) ** 2 + (entry[1] - start[1]) ** 2, zombie))
+
+        # Closest zombie along the path first
+        hits.sort(key=lambda hit: hit[0])
+        for _, zombie in hits:
+            bullet.hit_zombies.add(zombie)
+            blood_particles.spawn(zombie.rect.centerx, zombie.rect.centery, random.randint(5, 10))
+            zombie.health -= player.weapon.damage 
+            if zombie.health <= 0:
+                zombie_death_sound.play()
+                zombie.kill()
+            if bullet.pierce <= 0:
+                bullet.kill()
+                break
+            bullet.pierce -= 1
+
+        # Walls and max range kill only after the last segment had its chance to hit
+        if bullet.spent:
+            bullet.kill()
+
 def contain_zombies():
     for zombie in zombies:
         # Calculate push vector to keep zombie inside screen
@@ -1632,7 +2986,7 @@ def contain_zombies():
             zombie.path_update_timer = 0  # Will cause path to update next frame
         
 def initialize_game():
-    global zombie_wave, wave_ready, zombie_health, player_money, all_sprites, zombies, bullets, spit_projectiles, player, player_health, farm, wave_start_time, showing_wave_warning, warning_start_time, pathfinding_grid
+    global zombie_wave, wave_ready, zombie_health, player_money, all_sprites, zombies, bullets, spit_projectiles, player, player_health, farm, wave_start_time, showing_wave_warning, warning_start_time, pathfinding_grid, path_scheduler, path_service
     
     # Reset game state variables
     zombie_wave = 0 # Edit for cheats and debug
@@ -1644,13 +2998,17 @@ def initialize_game():
 
     # Initialize pathfinding grid
     pathfinding_grid = PathfindingGrid()
+    path_scheduler = PathScheduler()
+    path_service = AsyncPathService(pathfinding_grid, path_executor)
 
     # Wave timeout variables
     wave_start_time = 0
     showing_wave_warning = False
     warning_start_time = 0
     
-    # Clear all sprite groups
+    # Hand flying projectiles back to their pools, then clear all sprite groups
+    for projectile in bullets.sprites() + spit_projectiles.sprites():
+        projectile.kill()
     all_sprites = pygame.sprite.Group()
     zombies = pygame.sprite.Group()
     bullets = pygame.sprite.Group()
@@ -1663,6 +3021,7 @@ def initialize_game():
     
     # Reset farm
     farm = Farm()
+    blood_particles.clear()
     
     # Reset weapon purchases (only keep Pistol)
     for weapon in weapons.values():
@@ -1671,6 +3030,9 @@ def initialize_game():
     player.purchased_weapons = ["Pistol"]
     player.equip_weapon("Pistol")
     
+    # The death screen drew over everything
+    screen_renderer.invalidate()
+
     # Start first wave
     start_next_wave()
 
@@ -1690,9 +3052,7 @@ def check_wave_timeout():
     
     # If warning is active and 10 seconds have passed
     if showing_wave_warning and current_time - warning_start_time > WAVE_WARNING_DURATION:
-        for _ in range(random.randint(8, 15)):
-            particle = BloodParticle(player.rect.centerx, player.rect.centery)
-            all_sprites.add(particle)
+        blood_particles.spawn(player.rect.centerx, player.rect.centery, random.randint(8, 15))
         if player_health.take_damage(1):  
             play_death_animation()
             return
@@ -1713,56 +3073,90 @@ def draw_wave_warning(screen):
         seconds_left = math.ceil(time_left / 1000)
         
         # Draw warning at top center of screen
-        warning_text = font.render(f"Next wave forced in: {seconds_left}", True, RED)
-        screen.blit(warning_text, (WIDTH // 2 - warning_text.get_width() // 2, 10))
+        warning_text = text_cache.render(font, f"Next wave forced in: {seconds_left}", RED)
+        return screen.blit(warning_text, (WIDTH // 2 - warning_text.get_width() // 2, 10))
+
+# Debug overlay layers, the grid and obstacles only change with the pathfinding grid so they are kept between frames
+class DebugOverlay:
+    def __init__(self):
+        self.static_layer = None
+        self.static_key = None  # (show grid, show obstacles, grid, obstacle_version) the static layer was drawn for
+        self.path_layer = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self.path_area = None  # Bounding rect of what path_layer holds, cleared before drawing again
+        self.rebuilds = 0
+
+    def draw_static_layer(self):
+        layer = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+
+        # Draw grid if enabled
+        if DEBUG_SHOW_GRID:
+            for x in range(0, WIDTH, GRID_SIZE):
+                pygame.draw.line(layer, (50, 50, 50, 100), (x, 0), (x, HEIGHT), 1)
+            for y in range(0, HEIGHT, GRID_SIZE):
+                pygame.draw.line(layer, (50, 50, 50, 100), (0, y), (WIDTH, y), 1)
+        
+        # Draw obstacles if enabled
+        if DEBUG_SHOW_OBSTACLES:
+            # Draw collision boxes
+            for object in COLLISION_RECTS:
+                pygame.draw.rect(layer, (255, 0, 0, 100), object, 2)
+            
+            # Draw grid obstacles
+            for y in range(GRID_HEIGHT):
+                for x in range(GRID_WIDTH):
+                    if not pathfinding_grid.is_walkable(x, y):
+                        rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+                        pygame.draw.rect(layer, (255, 0, 0, 50), rect)
+
+        # Mostly transparent and never drawn on again, run length encoding makes blitting it several times faster
+        self.static_layer = layer.convert_alpha()
+        self.static_layer.set_alpha(255, pygame.RLEACCEL)
+        self.rebuilds += 1
+
+    def draw_path_layer(self):
+        layer = self.path_layer
+        if self.path_area:
+            layer.fill((0, 0, 0, 0), self.path_area)
+        rects = []
 
-def draw_debug_info(screen):
-    if not DEBUG_MODE:
-        return
-    
-    # Create a temporary surface for transparent debug elements
-    debug_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    
-    # Draw grid if enabled
-    if DEBUG_SHOW_GRID:
-        for x in range(0, WIDTH, GRID_SIZE):
-            pygame.draw.line(debug_surface, (50, 50, 50, 100), (x, 0), (x, HEIGHT), 1)
-        for y in range(0, HEIGHT, GRID_SIZE):
-            pygame.draw.line(debug_surface, (50, 50, 50, 100), (0, y), (WIDTH, y), 1)
-    
-    # Draw obstacles if enabled
-    if DEBUG_SHOW_OBSTACLES:
-        # Draw collision boxes
-        for object in COLLISION_RECTS:
-            pygame.draw.rect(debug_surface, (255, 0, 0, 100), object, 2)
-        
-        # Draw grid obstacles
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if not pathfinding_grid.is_walkable(x, y):
-                    rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-                    pygame.draw.rect(debug_surface, (255, 0, 0, 50), rect)
-    
-    # Draw zombie paths if enabled
-    if DEBUG_SHOW_PATHS:
         for zombie in zombies:
             if hasattr(zombie, 'path') and zombie.path:
                 # Draw path lines
                 if len(zombie.path) > 1:
-                    points = [pygame.math.Vector2(point) for point in zombie.path]
-                    pygame.draw.lines(debug_surface, (0, 255, 0, 200), False, points, 2)
+                    rects.append(pygame.draw.lines(layer, (0, 255, 0, 200), False, zombie.path, 2))
                 
                 # Draw current target
                 if zombie.current_target_index < len(zombie.path):
                     target = zombie.path[zombie.current_target_index]
-                    pygame.draw.circle(debug_surface, (255, 255, 0, 200), (int(target[0]), int(target[1])), 5)
+                    rects.append(pygame.draw.circle(layer, (255, 255, 0, 200), (int(target[0]), int(target[1])), 5))
                 
                 # Draw all waypoints
                 for point in zombie.path:
-                    pygame.draw.circle(debug_surface, (0, 200, 200, 200), (int(point[0]), int(point[1])), 3)
+                    rects.append(pygame.draw.circle(layer, (0, 200, 200, 200), (int(point[0]), int(point[1])), 3))
+        self.path_area = rects[0].unionall(rects[1:]) if rects else None
+
+    def draw(self, screen):
+        if DEBUG_SHOW_GRID or DEBUG_SHOW_OBSTACLES:
+            # is_walkable only reports graves, so zombie movement doesn't invalidate the layer
+            key = (DEBUG_SHOW_GRID, DEBUG_SHOW_OBSTACLES, pathfinding_grid, pathfinding_grid.obstacle_version)
+            if key != self.static_key:
+                self.draw_static_layer()
+                self.static_key = key
+            screen.blit(self.static_layer, (0, 0))
+
+        # Draw zombie paths if enabled
+        if DEBUG_SHOW_PATHS:
+            self.draw_path_layer()
+            if self.path_area:
+                screen.blit(self.path_layer, self.path_area, self.path_area)
+
+debug_overlay = DebugOverlay()
+
+def draw_debug_info(screen):
+    if not DEBUG_MODE:
+        return
     
-    # Blit the debug surface onto the screen
-    screen.blit(debug_surface, (0, 0))
+    debug_overlay.draw(screen)
     
     # Draw debug HUD 
     debug_text = [
@@ -1771,12 +3165,137 @@ def draw_debug_info(screen):
         f"Paths: {'ON (F4)' if DEBUG_SHOW_PATHS else 'OFF (F4)'}",
         f"Obstacles: {'ON (F5)' if DEBUG_SHOW_OBSTACLES else 'OFF (F5)'}",
         f"Zombies: {len(zombies)}",
-        f"Active Paths: {sum(1 for z in zombies if hasattr(z, 'path') and z.path)}"
+        f"Active Paths: {sum(1 for z in zombies if hasattr(z, 'path') and z.path)}",
+        f"Path cache: {pathfinding_grid.path_cache.hits} hits / {pathfinding_grid.path_cache.misses} misses",
+        f"Path queue: {len(path_scheduler.pending)} waiting, {path_scheduler.served_last_frame} served",
+        f"Assets: {len(assets.assets)} loaded, {assets.total_bytes() / (1024 * 1024):.1f} MB",
+        f"Text cache: {text_cache.cache.hits} hits / {text_cache.cache.misses} misses",
+        f"Particles: {len(blood_particles)}/{blood_particles.capacity} ({blood_particles.dropped} dropped)",
+        f"Bullets: {bullet_pool.stats()}",
+        f"Spit: {spit_pool.stats()}"
     ]
     
     for i, text in enumerate(debug_text):
-        text_surface = font.render(text, True, WHITE)
-        screen.blit(text_surface, (10, HEIGHT - 150 + i * 25))
+        text_surface = text_cache.render(font, text, WHITE)
+        screen.blit(text_surface, (10, HEIGHT - 25 * len(debug_text) + i * 25))
+
+# Dirty rect rendering, restores the background only under what was drawn last frame and pushes just the changed areas
+class DirtyRectRenderer:
+    def __init__(self, max_fraction=DIRTY_RECT_MAX_FRACTION, tile=DIRTY_RECT_TILE, max_rects=DIRTY_RECT_MAX_RECTS):
+        self.max_area = WIDTH * HEIGHT * max_fraction
+        self.max_rects = max_rects
+        self.tile = tile
+        self.columns = (WIDTH + tile - 1) // tile
+        self.rows = (HEIGHT + tile - 1) // tile
+        self.screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        # Overlapping rects ( particles, sprites over sprites ) land on the same tiles, so they're counted once
+        self.tiles = bytearray(self.columns * self.rows)  # Tiles drawn this frame
+        self.previous_tiles = bytearray(self.columns * self.rows)  # Tiles drawn last frame
+        self.previous = []  # Merged rects drawn last frame
+        self.full_redraw = True  # Next clear has to restore the whole screen
+        self.frame_full = True
+        self.full_frames = 0
+        self.dirty_frames = 0
+
+    def invalidate(self):
+        # Something drew over the screen without marking it ( shop, death screen )
+        self.full_redraw = True
+
+    def clear(self, screen, background, full=False):
+        self.frame_full = full or self.full_redraw or not USE_DIRTY_RECTS
+        self.full_redraw = False
+        for rect in [screen.get_rect()] if self.frame_full else self.previous:
+            if background:
+                screen.blit(background, rect, rect)
+            else:
+                screen.fill(BLACK, rect)
+        self.tiles = bytearray(self.columns * self.rows)
+
+    def mark(self, rect):
+        if rect is not None:
+            self.add(rect)
+        return rect
+
+    def mark_all(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def add(self, rect):
+        left, top, width, height = rect
+        if width <= 0 or height <= 0:
+            return
+        tile = self.tile
+        x1 = left // tile
+        x2 = (left + width - 1) // tile
+        y1 = top // tile
+        y2 = (top + height - 1) // tile
+        if x1 < 0:
+            x1 = 0
+        if y1 < 0:
+            y1 = 0
+        if x2 >= self.columns:
+            x2 = self.columns - 1
+        if y2 >= self.rows:
+            y2 = self.rows - 1
+        if x1 > x2 or y1 > y2:
+            return
+        if x1 == x2 and y1 == y2:
+            self.tiles[y1 * self.columns + x1] = 1
+            return
+        run = b"\x01" * (x2 + 1 - x1)
+        for y in range(y1, y2 + 1):
+            row = y * self.columns
+            self.tiles[row + x1:row + x2 + 1] = run
+
+    def merge(self, tiles):
+        # Runs of marked tiles per row, a run repeated on the next row grows down instead of adding a rect
+        tile = self.tile
+        columns = self.columns
+        rects = []
+        open_runs = {}
+        for y in range(self.rows):
+            line = tiles[y * columns:(y + 1) * columns]
+            runs = {}
+            start = line.find(1)
+            while start != -1:
+                end = line.find(0, start)
+                if end == -1:
+                    end = columns
+                rect = open_runs.get((start, end))
+                if rect:
+                    rect.h += tile
+                else:
+                    rect = pygame.Rect(start * tile, y * tile, (end - start) * tile, tile)
+                    rects.append(rect)
+                runs[(start, end)] = rect
+                start = line.find(1, end)
+            open_runs = runs
+        return [rect.clip(self.screen_rect) for rect in rects]
+
+    def present(self, full=False):
+        # full means something unmarked ( debug overlay ) was drawn, it stays until the next full clear
+        size = len(self.tiles)
+        dirty = (int.from_bytes(self.previous_tiles, "big") | int.from_bytes(self.tiles, "big")).to_bytes(size, "big")
+        rects = None
+        if not (full or self.frame_full or self.full_redraw or dirty.count(1) * self.tile * self.tile > self.max_area):
+            rects = self.merge(dirty)
+        if rects is None or len(rects) > self.max_rects:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(rects)
+            self.dirty_frames += 1
+        self.previous_tiles = self.tiles
+        self.previous = self.merge(self.tiles)
+        if full:
+            self.full_redraw = True
+
+screen_renderer = DirtyRectRenderer()
+
+# HUD widgets
+wave_hud = TextWidget(font, WHITE, lambda: f"Wave: {zombie_wave}")
+money_hud = TextWidget(font, WHITE, lambda: f"Money: {player_money}")
+ammo_hud = TextWidget(font, WHITE, lambda: f"Ammo: {player.ammo}/{player.weapon.ammo}")
 
 def main():
     global zombie_wave, wave_ready, zombie_health, player_money, all_sprites, zombies, bullets, spit_projectiles, player, player_health, farm, DEBUG_MODE, DEBUG_SHOW_GRID, DEBUG_SHOW_OBSTACLES, DEBUG_SHOW_PATHS, background, TEXT_BOBBING_INTERVAL, TEXT_BOBBING_RANGE, TEXT_BOBBING_STEP
@@ -1785,17 +3304,15 @@ def main():
 
     running = True
     try:
-        background = pygame.image.load("Images/background.png").convert()
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT)) 
+        background = assets.image("Images/background.png", alpha=False, size=(WIDTH, HEIGHT))
     except:
         print("Background image not found! Using fallback color.")
         background = None
+    if ASSET_REPORT:
+        assets.report()
 
     while running:
-        if background:
-            screen.blit(background, (0, 0))
-        else:
-            screen.fill(BLACK)
+        screen_renderer.clear(screen, background, full=DEBUG_MODE)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -1817,6 +3334,7 @@ def main():
                     player.start_reload()
                 if keys[pygame.K_b]:
                     show_shop()
+                    screen_renderer.invalidate()
                 if event.key == pygame.K_e:
                     # Check if player is close to farm
                     player_to_farm_dist = math.sqrt((player.rect.centerx - farm.rect.centerx)**2 + 
@@ -1840,11 +3358,22 @@ def main():
                 start_next_wave()
                 pygame.time.set_timer(NEXT_WAVE_EVENT, 0)  # Stop the event until it's needed again
 
+        # Bucket zombies once per frame for neighbor lookups
+        zombie_hash.rebuild(zombies)
+
         # Update all game objects
         all_sprites.update()
+        blood_particles.update()
+
+        # Push overlapping zombies apart
+        if USE_BATCH_SEPARATION:
+            separate_zombies(zombies)
 
         pathfinding_grid.update_zombie_positions(zombies)
 
+        # Serve as many path requests as the frame budget allows
+        path_scheduler.run(player.rect.center)
+
         handle_stuck_entities()
 
         contain_zombies()
@@ -1853,24 +3382,12 @@ def main():
         player_health.update()
 
         # Check bullet collisions with zombies
-        for bullet in bullets:
-            hit_zombies = pygame.sprite.spritecollide(bullet, zombies, False)
-            for zombie in hit_zombies:
-                for _ in range(random.randint(5, 10)):
-                    particle = BloodParticle(zombie.rect.centerx, zombie.rect.centery)
-                    all_sprites.add(particle)
-                zombie.health -= player.weapon.damage 
-                bullet.kill()
-                if zombie.health <= 0:
-                    zombie_death_sound.play()
-                    zombie.kill()
+        handle_bullet_hits()
         
         # Check spit collisions with player
         if not DEBUG_MODE:
             for spit in pygame.sprite.spritecollide(player, spit_projectiles, True):
-                for _ in range(random.randint(3, 6)):
-                    particle = BloodParticle(player.rect.centerx, player.rect.centery)
-                    all_sprites.add(particle)
+                blood_particles.spawn(player.rect.centerx, player.rect.centery, random.randint(3, 6))
                 if player_health.take_damage(1):  # 1 heart of damage per spit
                     play_death_animation()
         
@@ -1884,12 +3401,14 @@ def main():
             
 
         # Draw farm
-        farm.draw(screen)
+        screen_renderer.mark(farm.draw(screen))
         for sprite in all_sprites:
             if isinstance(sprite, Player):
                 sprite.draw(screen)
             else:
                 screen.blit(sprite.image, sprite.rect.topleft)
+            screen_renderer.mark(sprite.rect)
+        screen_renderer.mark_all(blood_particles.draw(screen))
 
         for zombie in zombies:
             if hasattr(zombie, 'stuck_timer') and zombie.stuck_timer > 0:
@@ -1918,17 +3437,17 @@ def main():
             farm.bob_offset = max(-TEXT_BOBBING_RANGE, min(TEXT_BOBBING_RANGE, farm.bob_offset))
             
             if farm.seed_planted is None:
-                text = font.render("Press E to plant", True, WHITE)
+                text = text_cache.render(font, "Press E to plant", WHITE)
             else:
                 if (pygame.time.get_ticks() - farm.seed_planted) / 1000 >= 15:
-                    text = font.render("Press E to harvest", True, WHITE)
+                    text = text_cache.render(font, "Press E to harvest", WHITE)
                 else:
-                    text = font.render("Growing...", True, WHITE)
+                    text = text_cache.render(font, "Growing...", WHITE)
             
             # Apply the offset
             text_rect = text.get_rect(center=(farm.rect.centerx, farm.rect.top - 20 + farm.bob_offset))
 
-            screen.blit(text, text_rect)
+            screen_renderer.mark(screen.blit(text, text_rect))
 
         # Draw Zombie HB
         for zombie in zombies:
@@ -1938,7 +3457,7 @@ def main():
             bar_y = zombie.rect.top - 15
             
             # Draw background ( total health )
-            pygame.draw.rect(screen, RED, (bar_x, bar_y, health_width, health_height))
+            screen_renderer.mark(pygame.draw.rect(screen, RED, (bar_x, bar_y, health_width, health_height)))
 
             # Draw current health
             current_width = (zombie.health / zombie.max_health) * health_width
@@ -1949,23 +3468,23 @@ def main():
 
         # Draw wave warning if active
         if showing_wave_warning:
-            draw_wave_warning(screen)
+            screen_renderer.mark(draw_wave_warning(screen))
 
         # Draw HUD
-        player_health.draw(screen)
-        wave_text = font.render(f"Wave: {zombie_wave}", True, WHITE)
-        money_text = font.render(f"Money: {player_money}", True, WHITE)
-        screen.blit(wave_text, (10, 10 + player_health.heart_height + 10))
-        screen.blit(money_text, (10, 10 + player_health.heart_height + 40))
+        screen_renderer.mark(player_health.draw(screen))
+        screen_renderer.mark(wave_hud.draw(screen, (10, 10 + player_health.heart_height + 10)))
+        screen_renderer.mark(money_hud.draw(screen, (10, 10 + player_health.heart_height + 40)))
         player.update_reload()
-        player.draw_ammo(screen)
+        screen_renderer.mark(player.draw_ammo(screen))
 
         draw_debug_info(screen)   
 
-        pygame.display.flip()
+        screen_renderer.present(full=DEBUG_MODE)
         clock.tick(FPS)
 
 show_start_menu()
 main()
 
+if path_executor:
+    path_executor.shutdown(cancel_futures=True)
 pygame.quit()
\ No newline at end of file